@@ -1,4 +1,7 @@
+import asyncio
 import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -19,7 +22,7 @@ from .elements.dialogs import (
 )
 from .elements.downloads import DownloadsPanel
 from .elements.sidebar import Sidebar
-from .util.downloads import DownloadManager
+from .util.downloads import DownloadManager, DownloadStatus
 from .util.steamgrid import SteamGridDB
 from .util.theme import ThemeManager
 from .views.console import ConsoleView
@@ -33,6 +36,7 @@ class VRetroApp:
         self.page.title = "vretro"
         self.page.padding = 0
         self.page.window.icon = "gui/assets/logo.png"
+        self._batch_state = threading.local()
         # self.page.show_semantics_debugger = True
 
         config_path = get_config_path()
@@ -63,6 +67,7 @@ class VRetroApp:
         )
 
         self.download_manager.add_callback(self._on_download_complete)
+        self._completed_since_reload = False
 
         self.current_console: Optional[str] = None
         self.current_game = None
@@ -73,7 +78,26 @@ class VRetroApp:
         theme = self.theme_manager.create_theme()
         self.page.theme = theme
         self.page.dark_theme = theme
-        self.page.update()
+        self.update_page()
+
+    @contextmanager
+    def batch_updates(self):
+        state = self._batch_state
+        state.depth = getattr(state, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            state.depth -= 1
+            if state.depth == 0 and getattr(state, "dirty", False):
+                state.dirty = False
+                self.page.update()
+
+    def update_page(self) -> None:
+        state = self._batch_state
+        if getattr(state, "depth", 0):
+            state.dirty = True
+        else:
+            self.page.update()
 
     def _show_first_time_setup(self) -> None:
         dialog = FirstTimeSetupDialog(self.page, self._on_setup_complete)
@@ -106,7 +130,8 @@ class VRetroApp:
 
     def _load_library(self) -> None:
         self.library.scan(verbose=False)
-        self.sidebar.refresh()
+        self.sidebar.invalidate_icons()
+        self.sidebar.request_refresh()
 
     def _show_welcome(self) -> None:
         self.current_console = None
@@ -116,7 +141,7 @@ class VRetroApp:
             self._apply_theme()
         view = WelcomeView(self)
         self.main_content.content = view.create()
-        self.page.update()
+        self.update_page()
 
     def show_console(self, console_code: str) -> None:
         self.current_console = console_code
@@ -135,8 +160,8 @@ class VRetroApp:
 
         view = ConsoleView(self, console_meta, self.all_games)
         self.main_content.content = view.create()
-        self.sidebar.refresh()
-        self.page.update()
+        self.sidebar.request_refresh()
+        self.update_page()
 
     def show_game(self, game) -> None:
         self.current_game = game
@@ -149,8 +174,8 @@ class VRetroApp:
 
         view = GameView(self, game)
         self.main_content.content = view.create()
-        self.sidebar.refresh()
-        self.page.update()
+        self.sidebar.request_refresh()
+        self.update_page()
 
     def show_settings(self) -> None:
         dialog = SettingsDialog(self.page, self.config, self._on_settings_saved)
@@ -161,10 +186,11 @@ class VRetroApp:
         self.theme_manager.set_theme_mode(self.config.theme_mode)
         if self.config.primary_color:
             self.theme_manager.set_primary_color(self.config.primary_color)
-        self._apply_theme()
-        self.steamgrid.api_key = self.config.steamgrid_api_key
-        self.library = GameLibrary(self.config.get_games_root())
-        self._load_library()
+        with self.batch_updates():
+            self._apply_theme()
+            self.steamgrid.api_key = self.config.steamgrid_api_key
+            self.library = GameLibrary(self.config.get_games_root())
+            self._load_library()
 
     def show_install_console(self) -> None:
         dialog = InstallConsoleDialog(
@@ -187,16 +213,33 @@ class VRetroApp:
         )
         self.page.show_dialog(dialog.create())
 
-    def _on_download_complete(self):
+    def _on_download_complete(self, changed: set[str]):
         try:
+            if any(
+                task and task.status == DownloadStatus.COMPLETE
+                for task in map(self.download_manager.get_task, changed)
+            ):
+                self._completed_since_reload = True
+
+            if not self._completed_since_reload:
+                return
+
             active_tasks = self.download_manager.get_active_tasks()
 
             if len(active_tasks) == 0:
-                self._load_library()
-
-                if self.current_console:
-                    self.show_console(self.current_console)
-                else:
-                    self._show_welcome()
+                self._completed_since_reload = False
+                self.page.run_task(self._reload_after_downloads)
         except Exception:
             pass
+
+    async def _reload_after_downloads(self) -> None:
+        await asyncio.to_thread(self.library.scan, verbose=False)
+
+        with self.batch_updates():
+            self.sidebar.invalidate_icons()
+            self.sidebar.request_refresh()
+
+            if self.current_console:
+                self.show_console(self.current_console)
+            else:
+                self._show_welcome()
@@ -1,24 +1,185 @@
+import asyncio
+import difflib
+import hashlib
+import json
 import logging
+import os
+import re
+import subprocess
 import sys
+import tempfile
 import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable, Set
+from typing import TYPE_CHECKING, Callable, Optional, Set
 
 import flet as ft
+import requests
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from gui.util.downloads import DownloadManager
-from src.data.config import VRetroConfig
+from src.data.config import VRetroConfig, get_config_dir
 from src.data.console import get_console_metadata
 from src.data.library import GameMetadata
-from src.util.download import download_emulator
-from src.util.gb import GameBananaAPI
-from src.util.mods import ModInfo, ModManager
-from src.util.steam import SteamManager
+from src.util.net import get_session
+
+if TYPE_CHECKING:
+    from gui.util.downloads import DownloadManager
+    from src.util.mods import ModInfo, ModManager
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_GAMES_DIR = str(Path.home() / "games")
+_REGIONS = ("NA", "EU", "JP", "KR", "CN")
+_GAME_CARD_HEIGHT = 140
+_GAME_CARD_SPACING = 10
+_thumb_pool = ThreadPoolExecutor(max_workers=8)
+_TITLE_SEPARATORS = re.compile(r"[\W_]+")
+_NUMBER_TOKEN = re.compile(r"\d+|(?=[ivx])x{0,3}(?:ix|iv|v?i{0,3})")
+_THEME_MODES = (
+    ("light", "light"),
+    ("dark", "dark"),
+    ("system", "system (follow xresources)"),
+    ("dynamic", "dynamic (from artwork)"),
+)
+
+_message_dialogs: dict[int, ft.AlertDialog] = {}
+_EMULATOR_STATUS_TTL = 30.0
+_emulator_installed: dict[Path, tuple[float, bool]] = {}
+
+
+def show_message(page: ft.Page, title: str, message: str) -> None:
+    dialog = _message_dialogs.get(id(page))
+
+    if dialog is None:
+        dialog = ft.AlertDialog(
+            title=ft.Text(title),
+            content=ft.Text(message),
+            actions=[ft.TextButton("ok", on_click=lambda _: page.pop_dialog())],
+        )
+        _message_dialogs[id(page)] = dialog
+    else:
+        dialog.title.value = title
+        dialog.content.value = message
+
+    if dialog.open:
+        dialog.update()
+    else:
+        page.show_dialog(dialog)
+
+
+def _normalize_title(name: str) -> str:
+    return sys.intern(_TITLE_SEPARATORS.sub(" ", name.casefold()).strip())
+
+
+def _number_tokens(key: str) -> frozenset:
+    return frozenset(
+        token for token in key.split() if _NUMBER_TOKEN.fullmatch(token)
+    )
+
+
+def _match_results(vrdb_games: list, igdb_games: list) -> list[tuple]:
+    vrdb_map = {_normalize_title(gn): (gn, src) for gn, src in vrdb_games}
+    vrdb_numbers = {key: _number_tokens(key) for key in vrdb_map}
+    results = []
+
+    for igdb_game in igdb_games[:30]:
+        key = _normalize_title(igdb_game.name)
+        if key not in vrdb_map:
+            numbers = _number_tokens(key)
+            candidates = [
+                name for name in vrdb_map if vrdb_numbers[name] == numbers
+            ]
+            close = difflib.get_close_matches(key, candidates, n=1, cutoff=0.88)
+            if close:
+                key = close[0]
+
+        vrdb_match = vrdb_map.pop(key, None)
+
+        if vrdb_match:
+            vrdb_name, source = vrdb_match
+            results.append((vrdb_name, source, igdb_game))
+
+    for vrdb_name, source in vrdb_map.values():
+        results.append((vrdb_name, source, None))
+
+    return results
+
+
+def _fetch_bytes(url: str) -> Optional[bytes]:
+    try:
+        response = get_session().get(url, timeout=5)
+        if response.status_code == 200:
+            return response.content
+    except requests.RequestException:
+        pass
+    return None
+
+
+def _is_installed(path: Path) -> bool:
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except OSError:
+        return False
+
+
+class _NotifyMixin:
+    def _show_error(self, title: str, message: str) -> None:
+        show_message(self.page, title, message)
+
+    def _show_info(self, title: str, message: str) -> None:
+        show_message(self.page, title, message)
+
+
+@lru_cache(maxsize=64)
+def _dir_entries(directory: Path, mtime: float) -> frozenset[str]:
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+def _image_src(path: Path) -> Optional[str]:
+    try:
+        mtime = path.parent.stat().st_mtime
+    except OSError:
+        return None
+    return str(path) if path.name in _dir_entries(path.parent, mtime) else None
+
+
+def _hero_composite(hero_path: Path, logo_path: Path) -> Optional[Path]:
+    key = hashlib.sha1(str(hero_path.resolve()).encode()).hexdigest()
+    composite_path = get_config_dir() / "cache" / "composites" / f"{key}.png"
+
+    try:
+        newest = max(hero_path.stat().st_mtime, logo_path.stat().st_mtime)
+        if composite_path.exists() and composite_path.stat().st_mtime >= newest:
+            return composite_path
+
+        composite_path.parent.mkdir(parents=True, exist_ok=True)
+
+        from PIL import Image, ImageOps
+
+        composite = ImageOps.fit(Image.open(hero_path).convert("RGBA"), (600, 300))
+
+        gradient = Image.linear_gradient("L").resize((600, 300))
+        shade = Image.new("RGBA", (600, 300))
+        shade.putalpha(gradient.point(lambda v: v * 0xCC // 255))
+        composite.alpha_composite(shade)
+
+        logo = Image.open(logo_path).convert("RGBA")
+        logo.thumbnail((300, 260))
+        composite.alpha_composite(logo, (20, 300 - logo.height - 20))
+
+        composite.save(composite_path, optimize=True)
+        return composite_path
+    except Exception:
+        return None
+
 
 class FirstTimeSetupDialog:
     def __init__(self, page: ft.Page, on_complete: Callable) -> None:
@@ -28,7 +189,7 @@ class FirstTimeSetupDialog:
     def create(self) -> ft.AlertDialog:
         self.dir_input = ft.TextField(
             label="games directory",
-            value=str(Path.home() / "games"),
+            value=_DEFAULT_GAMES_DIR,
             expand=True,
         )
 
@@ -65,7 +226,7 @@ class FirstTimeSetupDialog:
         )
 
     def _on_submit(self, e) -> None:
-        games_dir = self.dir_input.value or str(Path.home() / "games")
+        games_dir = self.dir_input.value or _DEFAULT_GAMES_DIR
         steamgrid_key = self.steamgrid_input.value.strip() or None
 
         config = VRetroConfig.default()
@@ -77,25 +238,25 @@ class FirstTimeSetupDialog:
         self.on_complete()
 
 
-class ConsoleConfigDialog:
-    def __init__(self, page, console_meta, library, on_save) -> None:
+class ConsoleConfigDialog(_NotifyMixin):
+    def __init__(
+        self, page, console_meta, library, on_save, download_manager
+    ) -> None:
         self.page = page
         self.console_meta = console_meta
         self.library = library
         self.on_save = on_save
+        self.download_manager = download_manager
+        self._alive = True
+        self._download_future = None
+        self._console_dir = library.console_root / console_meta.name
+        self._emulator_dir = self._console_dir / "emulator"
 
     def create(self):
-        console_dir = self.library.console_root / self.console_meta.name
-        emulator_dir = console_dir / "emulator"
-
-        emulator_status = (
-            "installed"
-            if emulator_dir.exists() and any(emulator_dir.iterdir())
-            else "not installed"
-        )
-
-        self.status_text = ft.Text(f"status: {emulator_status}")
-        self.progress_bar = ft.ProgressRing(visible=False)
+        self.status_text = ft.Text("status: checking...")
+        threading.Thread(target=self._probe_installed, daemon=True).start()
+        self.progress_bar = None
+        self._progress_slot = ft.Container()
         self.progress_text = ft.Text("", visible=False)
 
         content = ft.Column(
@@ -105,14 +266,14 @@ class ConsoleConfigDialog:
                 ft.Text(f"binary: {self.console_meta.emulator.binary}"),
                 self.status_text,
                 ft.Container(height=20),
-                self.progress_bar,
+                self._progress_slot,
                 self.progress_text,
                 ft.Container(height=20),
                 ft.Row(
                     [
                         ft.FilledButton(
                             "download emulator",
-                            on_click=lambda _: self._download_emulator(),
+                            on_click=self._download_emulator,
                         ),
                         ft.OutlinedButton(
                             "open emulator folder",
@@ -133,10 +294,13 @@ class ConsoleConfigDialog:
                         ft.Text(
                             "required bios files:", size=14, weight=ft.FontWeight.W_500
                         ),
-                        *[
-                            ft.Text(f"  • {bios}", size=12)
-                            for bios in self.console_meta.emulator.bios_files
-                        ],
+                        ft.Text(
+                            "\n".join(
+                                f"  • {bios}"
+                                for bios in self.console_meta.emulator.bios_files
+                            ),
+                            size=12,
+                        ),
                     ],
                     spacing=5,
                 ),
@@ -146,79 +310,89 @@ class ConsoleConfigDialog:
             title=ft.Text(f"{self.console_meta.name} configuration"),
             content=ft.Container(content=content, width=500),
             actions=[
-                ft.TextButton("close", on_click=lambda _: self.page.pop_dialog()),
+                ft.TextButton("close", on_click=lambda _: self._close()),
             ],
         )
 
-    def _download_emulator(self):
+    def _close(self) -> None:
+        self._alive = False
+        self.page.pop_dialog()
+
+    def _probe_installed(self) -> None:
+        now = time.monotonic()
+        cached = _emulator_installed.get(self._emulator_dir)
+        if cached and now - cached[0] < _EMULATOR_STATUS_TTL:
+            installed = cached[1]
+        else:
+            installed = _is_installed(self._emulator_dir)
+            _emulator_installed[self._emulator_dir] = (now, installed)
+
+        self.status_text.value = (
+            f"status: {'installed' if installed else 'not installed'}"
+        )
+        if self._alive:
+            self.page.update()
+
+    async def _download_emulator(self, e=None):
+        from src.util.download import download_emulator
+
         if not self.console_meta.emulator.download_url:
             self._show_error("error", "no download url available")
             return
 
-        console_dir = self.library.console_root / self.console_meta.name
-        emulator_dir = console_dir / "emulator"
+        if self._download_future and not self._download_future.done():
+            return
+
+        if self.progress_bar is None:
+            self.progress_bar = ft.ProgressRing()
+            self._progress_slot.content = self.progress_bar
 
         self.progress_bar.visible = True
         self.progress_text.visible = True
         self.progress_text.value = "downloading..."
         self.page.update()
 
-        def download_thread():
-            success = download_emulator(
-                self.console_meta.code,
-                self.console_meta.emulator.name,
-                self.console_meta.emulator.download_url,
-                emulator_dir,
-            )
+        self._download_future = self.download_manager.submit(
+            download_emulator,
+            self.console_meta.code,
+            self.console_meta.emulator.name,
+            self.console_meta.emulator.download_url,
+            self._emulator_dir,
+        )
+        try:
+            success = await asyncio.wrap_future(self._download_future)
+        except Exception:
+            success = False
 
-            self.progress_bar.visible = False
-            self.progress_text.visible = False
+        self.progress_bar.visible = False
+        self.progress_text.visible = False
 
-            if success:
-                self.status_text.value = "status: installed"
-                self._show_info("success", "emulator downloaded")
-            else:
-                self._show_error("error", "download failed")
+        if success:
+            _emulator_installed[self._emulator_dir] = (time.monotonic(), True)
+            self.status_text.value = "status: installed"
+            self._show_info("success", "emulator downloaded")
+        else:
+            self._show_error("error", "download failed")
 
+        if self._alive:
             self.page.update()
 
-        threading.Thread(target=download_thread, daemon=True).start()
-
     def _open_emulator_folder(self):
-        import subprocess
-
-        console_dir = self.library.console_root / self.console_meta.name
-        emulator_dir = console_dir / "emulator"
-
-        if emulator_dir.exists():
-            subprocess.Popen(["xdg-open", str(emulator_dir)])
+        if self._emulator_dir.exists():
+            subprocess.Popen(["xdg-open", str(self._emulator_dir)])
         else:
             self._show_info("not found", "emulator directory not found")
 
-    def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
-    def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
 
-class ConsoleArtworkDialog:
+class ConsoleArtworkDialog(_NotifyMixin):
     def __init__(self, page, console_meta, steamgrid, library, on_download) -> None:
         self.page = page
         self.console_meta = console_meta
         self.steamgrid = steamgrid
         self.library = library
         self.on_download = on_download
+        self._graphics_dir = library.console_root / console_meta.name / "graphics"
+        self._rendered: list[Optional[tuple[int, str]]] = [None] * 3
 
     def create(self):
         self.search_input = ft.TextField(
@@ -226,8 +400,25 @@ class ConsoleArtworkDialog:
             value=self.console_meta.name,
         )
 
+        self._empty_texts = [
+            ft.Text("no results found", visible=False) for _ in range(3)
+        ]
+        self._cards = [
+            [
+                ft.Container(
+                    content=ft.Image(src="", fit=ft.BoxFit.COVER),
+                    border_radius=8,
+                    ink=True,
+                    visible=False,
+                )
+                for _ in range(12)
+            ]
+            for _ in range(3)
+        ]
+
         self.results_grids = [
             ft.GridView(
+                controls=[empty_text, *cards],
                 expand=True,
                 runs_count=3,
                 max_extent=200,
@@ -235,7 +426,7 @@ class ConsoleArtworkDialog:
                 spacing=10,
                 run_spacing=10,
             )
-            for _ in range(3)
+            for empty_text, cards in zip(self._empty_texts, self._cards)
         ]
 
         tabs = ft.Tabs(
@@ -258,7 +449,7 @@ class ConsoleArtworkDialog:
                     ),
                 ],
             ),
-            on_change=lambda _: self._on_search(None),
+            on_change=self._on_search,
         )
 
         self.tabs = tabs
@@ -290,73 +481,53 @@ class ConsoleArtworkDialog:
             on_dismiss=lambda _: self.page.pop_dialog(),
         )
 
-    def _on_search(self, e) -> None:
+    async def _on_search(self, e) -> None:
         selected_index = self.tabs.selected_index
-        results = self.results_grids[selected_index]
-        results.controls.clear()
+        cards = iter(self._cards[selected_index])
 
-        games = self.steamgrid.search_game(self.search_input.value)
+        asset_type = ["heroes", "logos", "icons"][selected_index]
+        file_name = ["hero", "logo", "icon"][selected_index]
 
-        if not games:
-            results.controls.append(ft.Text("no results found"))
-            self.page.update()
+        games = await asyncio.to_thread(
+            self.steamgrid.search_game, self.search_input.value
+        )
+        key = (games[0].get("id"), asset_type) if games else None
+        if key is not None and self._rendered[selected_index] == key:
             return
 
-        game_id = games[0].get("id")
+        self._empty_texts[selected_index].visible = not games
 
-        asset_types = ["heroes", "logos", "icons"]
-        file_names = ["hero", "logo", "icon"]
-        asset_type = asset_types[selected_index]
-        file_name = file_names[selected_index]
+        if games:
+            assets = await asyncio.to_thread(
+                self.steamgrid.get_assets, key[0], asset_type
+            )
 
-        assets = self.steamgrid.get_assets(game_id, asset_type)
+            for asset in assets[:12]:
+                url = asset.get("thumb") or asset.get("url")
+                if not url:
+                    continue
 
-        for asset in assets[:12]:
-            url = asset.get("thumb") or asset.get("url")
-            if not url:
-                continue
+                card = next(cards)
+                card.content.src = url
+                card.on_click = partial(self._download, asset.get("url"), file_name)
+                card.visible = True
 
-            card = ft.Container(
-                content=ft.Image(src=url, fit=ft.BoxFit.COVER),
-                border_radius=8,
-                ink=True,
-                on_click=lambda _,
-                full_url=asset.get("url"),
-                fn=file_name: self._download(full_url, fn),
-            )
-            results.controls.append(card)
+        for card in cards:
+            card.visible = False
 
+        self._rendered[selected_index] = key
         self.page.update()
 
-    def _download(self, url: str, asset_type: str) -> None:
-        console_dir = self.library.console_root / self.console_meta.name
-        graphics_dir = console_dir / "graphics"
-        graphics_dir.mkdir(parents=True, exist_ok=True)
-        dest = graphics_dir / f"{asset_type}.png"
+    async def _download(self, url: str, asset_type: str, e=None) -> None:
+        dest = self._graphics_dir / f"{asset_type}.png"
 
-        if self.steamgrid.download_asset(url, dest):
+        if await asyncio.to_thread(self.steamgrid.download_asset, url, dest):
             self.page.pop_dialog()
             self._show_info("success", f"downloaded {asset_type}")
             self.on_download()
         else:
             self._show_error("error", "download failed")
 
-    def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
-    def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
 
 class SettingsDialog:
     def __init__(self, page: ft.Page, config: VRetroConfig, on_save: Callable) -> None:
@@ -378,13 +549,7 @@ class SettingsDialog:
         self.region_dropdown = ft.Dropdown(
             label="preferred region",
             value=self.config.preferred_region,
-            options=[
-                ft.dropdown.Option("NA"),
-                ft.dropdown.Option("EU"),
-                ft.dropdown.Option("JP"),
-                ft.dropdown.Option("KR"),
-                ft.dropdown.Option("CN"),
-            ],
+            options=[ft.dropdown.Option(region) for region in _REGIONS],
         )
 
         self.igdb_client_id = ft.TextField(
@@ -409,12 +574,7 @@ class SettingsDialog:
         self.theme_dropdown = ft.Dropdown(
             label="theme mode",
             value=self.config.theme_mode or "system",
-            options=[
-                ft.dropdown.Option("light", "light"),
-                ft.dropdown.Option("dark", "dark"),
-                ft.dropdown.Option("system", "system (follow xresources)"),
-                ft.dropdown.Option("dynamic", "dynamic (from artwork)"),
-            ],
+            options=[ft.dropdown.Option(key, text) for key, text in _THEME_MODES],
         )
 
         self.primary_color_input = ft.TextField(
@@ -422,12 +582,6 @@ class SettingsDialog:
             value=self.config.primary_color or "",
             hint_text="#1976d2",
         )
-        self.steamgrid_key = ft.TextField(
-            label="steamgriddb api key",
-            value=self.config.steamgrid_api_key or "",
-            password=True,
-            can_reveal_password=True,
-        )
 
         self.ra_api_key = ft.TextField(
             label="retroachievements api key",
@@ -533,7 +687,7 @@ class SettingsDialog:
             ],
         )
 
-    def _on_submit(self, e) -> None:
+    async def _on_submit(self, e) -> None:
         self.config.games_directory = self.games_dir_input.value
         self.config.fullscreen = self.fullscreen_check.value
         self.config.preferred_region = self.region_dropdown.value
@@ -553,12 +707,12 @@ class SettingsDialog:
         sg_key = self.steamgrid_key.value.strip()
         self.config.steamgrid_api_key = sg_key if sg_key else None
 
-        self.config.save()
+        await asyncio.to_thread(self.config.save)
         self.page.pop_dialog()
         self.on_save()
 
 
-class InstallConsoleDialog:
+class InstallConsoleDialog(_NotifyMixin):
     def __init__(
         self, page: ft.Page, library, sources, steamgrid, on_install: Callable
     ) -> None:
@@ -567,6 +721,12 @@ class InstallConsoleDialog:
         self.sources = sources
         self.steamgrid = steamgrid
         self.on_install = on_install
+        self._icon_pool = ThreadPoolExecutor(max_workers=8)
+        self._update_lock = threading.Lock()
+        self._update_timer: Optional[threading.Timer] = None
+        self.card_cache: dict[str, ft.Container] = {}
+        self._icon_widgets: dict[str, ft.Container] = {}
+        self._search_timer: Optional[threading.Timer] = None
 
     def create(self) -> ft.AlertDialog:
         self.search_input = ft.TextField(
@@ -577,14 +737,18 @@ class InstallConsoleDialog:
 
         self.console_list = ft.ListView(expand=True, spacing=5)
 
-        self.all_consoles = []
+        consoles = []
         for code in self.sources.list_consoles():
             vrdb_console = self.sources.vrdb.get_console(code)
             if vrdb_console:
-                self.all_consoles.append((code, vrdb_console))
+                consoles.append((vrdb_console.console.name, code, vrdb_console))
 
-        self.all_consoles.sort(key=lambda x: x[1].console.name)
-        self._populate_list()
+        consoles.sort(key=itemgetter(0))
+        self.all_consoles = [
+            (code, vrdb_console, code.lower(), name.lower())
+            for name, code, vrdb_console in consoles
+        ]
+        self.page.run_task(self._build_cards)
 
         return ft.AlertDialog(
             title=ft.Text("install console"),
@@ -598,39 +762,65 @@ class InstallConsoleDialog:
             ],
         )
 
+    async def _build_cards(self) -> None:
+        for start in range(0, len(self.all_consoles), 20):
+            for code, vrdb_console, _, _ in self.all_consoles[start : start + 20]:
+                self.card_cache[code] = self._create_console_card(code, vrdb_console)
+
+            self._populate_list(self.search_input.value or "")
+            await asyncio.sleep(0)
+
+        if self.steamgrid and self.steamgrid.api_key:
+            names = [
+                vrdb_console.console.name
+                for _, vrdb_console, _, _ in self.all_consoles
+            ]
+            game_ids = await asyncio.to_thread(self.steamgrid.search_games_bulk, names)
+
+            for code, vrdb_console, _, _ in self.all_consoles:
+                game_id = game_ids.get(vrdb_console.console.name)
+                if game_id is None:
+                    continue
+
+                self._icon_pool.submit(self._fetch_icon_url, game_id).add_done_callback(
+                    partial(self._set_icon, self._icon_widgets[code])
+                )
+
     def _populate_list(self, query: str = "") -> None:
-        self.console_list.controls.clear()
         query_lower = query.lower()
 
-        for code, vrdb_console in self.all_consoles:
-            name = vrdb_console.console.name
-            if not query or query_lower in code.lower() or query_lower in name.lower():
-                self._add_console_card(code, vrdb_console)
+        self.console_list.controls[:] = [
+            self.card_cache[code]
+            for code, _, code_lower, name_lower in self.all_consoles
+            if code in self.card_cache
+            and (
+                not query or query_lower in code_lower or query_lower in name_lower
+            )
+        ]
 
-        self.page.update()
+        self._schedule_update()
 
-    def _add_console_card(self, code: str, vrdb_console) -> None:
-        console = vrdb_console.console
+    def _schedule_update(self) -> None:
+        with self._update_lock:
+            if self._update_timer is None:
+                self._update_timer = threading.Timer(0.05, self._flush_update)
+                self._update_timer.daemon = True
+                self._update_timer.start()
 
-        icon_widget = None
+    def _flush_update(self) -> None:
+        with self._update_lock:
+            self._update_timer = None
+        self.page.update()
 
-        if self.steamgrid and self.steamgrid.api_key:
-            games = self.steamgrid.search_game(console.name)
-            if games and len(games) > 0:
-                game_id = games[0].get("id")
-                assets = self.steamgrid.get_assets(game_id, "icons")
-                if assets and len(assets) > 0:
-                    url = assets[0].get("thumb") or assets[0].get("url")
-                    if url:
-                        icon_widget = ft.Image(
-                            src=url,
-                            width=40,
-                            height=40,
-                            fit=ft.BoxFit.CONTAIN,
-                        )
+    def _create_console_card(self, code: str, vrdb_console) -> ft.Container:
+        console = vrdb_console.console
 
-        if not icon_widget:
-            icon_widget = ft.Icon(ft.Icons.VIDEOGAME_ASSET, size=40)
+        icon_widget = ft.Container(
+            content=ft.Icon(ft.Icons.VIDEOGAME_ASSET, size=40),
+            width=40,
+            height=40,
+        )
+        self._icon_widgets[code] = icon_widget
 
         title_text = ft.Text(
             console.name,
@@ -678,12 +868,12 @@ class InstallConsoleDialog:
                     spacing=5,
                 )
 
-            self.page.update()
+            self._schedule_update()
 
         install_btn = ft.FilledButton(
             "install",
             icon=ft.Icons.DOWNLOAD,
-            on_click=lambda _, c=code: self._install(c),
+            on_click=partial(self._install, code),
         )
 
         info_btn = ft.IconButton(
@@ -692,7 +882,7 @@ class InstallConsoleDialog:
             on_click=toggle_details,
         )
 
-        card = ft.Container(
+        return ft.Container(
             content=ft.Column(
                 [
                     ft.Row(
@@ -720,12 +910,38 @@ class InstallConsoleDialog:
             padding=10,
         )
 
-        self.console_list.controls.append(card)
+    def _fetch_icon_url(self, game_id: int) -> Optional[str]:
+        assets = self.steamgrid.get_assets(game_id, "icons")
+        if not assets:
+            return None
+
+        return assets[0].get("thumb") or assets[0].get("url")
+
+    def _set_icon(self, icon_widget: ft.Container, future) -> None:
+        if future.exception() or not future.result():
+            return
+
+        icon_widget.content = ft.Image(
+            src=future.result(),
+            width=40,
+            height=40,
+            fit=ft.BoxFit.CONTAIN,
+        )
+        self._schedule_update()
 
     def _on_search(self, e) -> None:
-        self._populate_list(e.control.value)
+        if self._search_timer:
+            self._search_timer.cancel()
+
+        self._search_timer = threading.Timer(
+            0.15, self._populate_list, args=(e.control.value,)
+        )
+        self._search_timer.daemon = True
+        self._search_timer.start()
+
+    async def _install(self, code: str, e=None) -> None:
+        from src.util.download import download_emulator
 
-    def _install(self, code: str) -> None:
         self.page.pop_dialog()
 
         meta = get_console_metadata(code.upper())
@@ -744,85 +960,87 @@ class InstallConsoleDialog:
             ),
             modal=True,
         )
+        progress_text = progress_dialog.content.controls[1]
 
         self.page.show_dialog(progress_dialog)
 
-        def install_thread():
-            try:
-                console_dir = self.library.create_console(code.upper(), meta)
+        try:
+            console_dir = await asyncio.to_thread(
+                self.library.create_console, code.upper(), meta
+            )
 
-                if self.steamgrid and self.steamgrid.api_key:
-                    progress_dialog.content.controls[1].value = "downloading artwork..."
-                    self.page.update()
+            if self.steamgrid and self.steamgrid.api_key:
+                progress_text.value = "downloading artwork..."
+                self.page.update()
 
-                    graphics_dir = console_dir / "graphics"
-                    graphics_dir.mkdir(parents=True, exist_ok=True)
+                graphics_dir = console_dir / "graphics"
+                graphics_dir.mkdir(parents=True, exist_ok=True)
 
-                    games = self.steamgrid.search_game(meta.name)
-                    if games and len(games) > 0:
-                        game_id = games[0].get("id")
+                games = await asyncio.to_thread(self.steamgrid.search_game, meta.name)
+                if games and len(games) > 0:
+                    game_id = games[0].get("id")
 
+                    jobs = [
+                        asyncio.to_thread(
+                            self._fetch_and_save,
+                            game_id,
+                            asset_type,
+                            file_name,
+                            graphics_dir,
+                        )
                         for asset_type, file_name in [
                             ("heroes", "hero"),
                             ("logos", "logo"),
                             ("icons", "icon"),
-                        ]:
-                            assets = self.steamgrid.get_assets(game_id, asset_type)
-                            if assets and len(assets) > 0:
-                                url = assets[0].get("url")
-                                if url:
-                                    dest = graphics_dir / f"{file_name}.png"
-                                    self.steamgrid.download_asset(url, dest)
-
-                if meta.emulator.download_url:
-                    progress_dialog.content.controls[
-                        1
-                    ].value = "downloading emulator..."
-                    self.page.update()
-
-                    emulator_dir = console_dir / "emulator"
-                    download_emulator(
-                        code,
-                        meta.emulator.name,
-                        meta.emulator.download_url,
-                        emulator_dir,
-                    )
-
-                self.page.pop_dialog()
+                        ]
+                    ]
+                    for done, job in enumerate(asyncio.as_completed(jobs), 1):
+                        await job
+                        progress_text.value = f"downloading artwork ({done}/3)..."
+                        self._schedule_update()
+
+            if meta.emulator.download_url:
+                progress_text.value = "downloading emulator..."
+                self.page.update()
+
+                await asyncio.to_thread(
+                    download_emulator,
+                    code,
+                    meta.emulator.name,
+                    meta.emulator.download_url,
+                    console_dir / "emulator",
+                )
 
-                info_text = f"created console: {code.upper()}\n\n{meta.name}"
-                if meta.emulator.requires_bios:
-                    info_text += "\n\nrequired bios files:"
-                    for bios in meta.emulator.bios_files:
-                        info_text += f"\n  • {bios}"
+            self.page.pop_dialog()
 
-                self._show_info("installation complete", info_text)
-                self.on_install()
+            info_text = f"created console: {code.upper()}\n\n{meta.name}"
+            if meta.emulator.requires_bios:
+                info_text += "\n\nrequired bios files:"
+                for bios in meta.emulator.bios_files:
+                    info_text += f"\n  • {bios}"
 
-            except Exception as e:
-                self.page.pop_dialog()
-                self._show_error("error", f"failed to create console: {e}")
+            self._show_info("installation complete", info_text)
+            self.on_install()
 
-        threading.Thread(target=install_thread, daemon=True).start()
+        except Exception as ex:
+            self.page.pop_dialog()
+            self._show_error("error", f"failed to create console: {ex}")
 
-    def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
+    def _fetch_and_save(
+        self, game_id, asset_type: str, file_name: str, graphics_dir: Path
+    ) -> None:
+        assets = self.steamgrid.get_assets(game_id, asset_type)
+        if assets and len(assets) > 0:
+            url = assets[0].get("url")
+            if url:
+                self.steamgrid.download_asset(url, graphics_dir / f"{file_name}.png")
 
-    def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
 
+class InstallGameDialog(_NotifyMixin):
+    _BORDER_SELECTED = ft.border.all(1, ft.Colors.PRIMARY)
+    _BORDER_UNSELECTED = ft.border.all(1, ft.Colors.OUTLINE)
+    _DETAILS_PADDING = ft.Padding.only(left=10)
 
-class InstallGameDialog:
     def __init__(
         self,
         page: ft.Page,
@@ -844,6 +1062,11 @@ class InstallGameDialog:
         self.on_install = on_install
         self.selected_games: Set[str] = set()
         self.game_results = []
+        self._search_generation = 0
+        self._card_cache: dict[int, ft.Control] = {}
+        self._card_by_name: dict[str, ft.Container] = {}
+        self._cover_cache: dict[str, bytes] = {}
+        self._cover_slots: dict[str, list[ft.Container]] = {}
 
     def create(self) -> ft.AlertDialog:
         self.search_input = ft.TextField(
@@ -852,10 +1075,12 @@ class InstallGameDialog:
             on_submit=lambda _: self._on_search(None),
         )
 
-        self.game_list = ft.Column(
-            spacing=10,
-            scroll=ft.ScrollMode.AUTO,
+        self.game_list = ft.ListView(
+            spacing=_GAME_CARD_SPACING,
             expand=True,
+            cache_extent=500,
+            scroll_interval=50,
+            on_scroll=self._on_results_scroll,
         )
 
         self.install_button = ft.FilledButton(
@@ -900,11 +1125,21 @@ class InstallGameDialog:
         )
 
     def _on_search(self, e) -> None:
-        query = self.search_input.value
+        query = (self.search_input.value or "").strip()
 
         if not query:
+            self.game_list.controls = [
+                ft.Text("enter a game title", color=ft.Colors.ON_SURFACE_VARIANT)
+            ]
+            self.page.update()
             return
 
+        self._search(query)
+
+    def _search(self, query: str) -> None:
+        self._search_generation += 1
+        generation = self._search_generation
+
         self.game_list.controls.clear()
         self.selected_games.clear()
         self.install_button.visible = False
@@ -917,55 +1152,113 @@ class InstallGameDialog:
         self.page.update()
 
         async def search_thread():
-            vrdb_games = self.sources.search_games(self.console.upper(), query)
-
-            igdb_games = self.db.search_games(query, self.console)
-
-            vrdb_map = {gn.lower(): (gn, src) for gn, src in vrdb_games}
-
-            self.game_results = []
-
-            for igdb_game in igdb_games[:30]:
-                game_name = igdb_game.name
-                vrdb_match = vrdb_map.get(game_name.lower())
-
-                if vrdb_match:
-                    vrdb_name, source = vrdb_match
-                    self.game_results.append((vrdb_name, source, igdb_game))
-                    del vrdb_map[game_name.lower()]
+            try:
+                vrdb_games, igdb_games = await asyncio.gather(
+                    asyncio.to_thread(
+                        self.sources.search_games, self.console.upper(), query
+                    ),
+                    asyncio.to_thread(self.db.search_games, query, self.console),
+                )
+                results = await asyncio.to_thread(
+                    _match_results, vrdb_games, igdb_games
+                )
+            except Exception as ex:
+                if generation == self._search_generation:
+                    self.game_list.controls = [
+                        ft.Text(f"search failed: {ex}", color=ft.Colors.ERROR)
+                    ]
                     self.page.update()
+                return
 
-            for vrdb_name, source in vrdb_map.values():
-                self.game_results.append((vrdb_name, source, None))
+            if generation != self._search_generation:
+                return
 
-            self.game_list.controls.clear()
+            self.game_results = results
+            self._card_cache.clear()
+            self._card_by_name.clear()
+            self._cover_slots.clear()
 
             if not self.game_results:
-                self.game_list.controls.append(
+                self.game_list.controls = [
                     ft.Text("no results found", color=ft.Colors.ON_SURFACE_VARIANT)
-                )
+                ]
             else:
-                for game_name, source, igdb_game in self.game_results:
-                    card = self._create_game_card(game_name, source, igdb_game)
-                    self.game_list.controls.append(card)
+                self.game_list.controls = [
+                    ft.Container(height=_GAME_CARD_HEIGHT) for _ in self.game_results
+                ]
+                self._materialize_cards(0)
 
             self.page.update()
 
         self.page.run_task(search_thread)
 
+    def _materialize_cards(self, first: int) -> bool:
+        changed = False
+        pending_covers = set(self._cover_slots)
+
+        for i in range(first, min(first + 8, len(self.game_results))):
+            if i in self._card_cache:
+                continue
+
+            card = self._create_game_card(*self.game_results[i])
+            self._card_cache[i] = card
+            self.game_list.controls[i] = card
+            changed = True
+
+        new_covers = self._cover_slots.keys() - pending_covers
+        if new_covers:
+            self.page.run_task(
+                self._fetch_covers, list(new_covers), self._search_generation
+            )
+
+        return changed
+
+    async def _fetch_covers(self, urls: list[str], generation: int) -> None:
+        async def fetch(url: str) -> None:
+            data = await asyncio.to_thread(_fetch_bytes, url)
+            if generation != self._search_generation:
+                return
+
+            slots = self._cover_slots.pop(url, [])
+            if not data:
+                return
+
+            self._cover_cache[url] = data
+            for slot in slots:
+                slot.content = ft.Image(
+                    src=data,
+                    width=80,
+                    height=120,
+                    fit=ft.BoxFit.COVER,
+                    border_radius=4,
+                )
+                try:
+                    slot.update()
+                except Exception:
+                    pass
+
+        await asyncio.gather(*(fetch(url) for url in urls))
+
+    def _on_results_scroll(self, e) -> None:
+        first = int(e.pixels // (_GAME_CARD_HEIGHT + _GAME_CARD_SPACING))
+        if self._materialize_cards(max(first, 0)):
+            self.game_list.update()
+
     def _create_game_card(self, game_name: str, source, igdb_game) -> ft.Control:
         is_selected = game_name in self.selected_games
 
         checkbox = ft.Checkbox(
             value=is_selected,
-            on_change=lambda e, gn=game_name: self._toggle_selection(gn),
+            on_change=partial(self._toggle_selection, game_name),
         )
 
         cover = None
 
-        if igdb_game and igdb_game.cover_url:
+        cover_url = igdb_game.cover_url if igdb_game else None
+
+        if cover_url and cover_url in self._cover_cache:
             cover = ft.Image(
-                src=igdb_game.cover_url,
+                src=self._cover_cache[cover_url],
                 width=80,
                 height=120,
                 fit=ft.BoxFit.COVER,
@@ -981,6 +1274,8 @@ class InstallGameDialog:
                 content=ft.Icon(ft.Icons.VIDEOGAME_ASSET, size=40),
                 alignment=ft.Alignment.CENTER,
             )
+            if cover_url:
+                self._cover_slots.setdefault(cover_url, []).append(cover)
 
         title_widget = ft.Text(
             game_name,
@@ -1011,10 +1306,10 @@ class InstallGameDialog:
                     )
                 )
 
-            if igdb_game.genres:
+            if igdb_game.display_genres:
                 info_widgets.append(
                     ft.Text(
-                        " • ".join(igdb_game.genres[:2]),
+                        igdb_game.display_genres,
                         size=12,
                         color=ft.Colors.ON_SURFACE_VARIANT,
                     )
@@ -1023,11 +1318,9 @@ class InstallGameDialog:
         info_column = ft.Column(info_widgets, spacing=4) if info_widgets else None
 
         summary = None
-        if igdb_game and igdb_game.summary:
+        if igdb_game and igdb_game.display_summary:
             summary = ft.Text(
-                igdb_game.summary[:200] + "..."
-                if len(igdb_game.summary) > 200
-                else igdb_game.summary,
+                igdb_game.display_summary,
                 size=12,
                 color=ft.Colors.ON_SURFACE_VARIANT,
                 max_lines=3,
@@ -1043,11 +1336,9 @@ class InstallGameDialog:
         install_btn = ft.IconButton(
             icon=ft.Icons.DOWNLOAD,
             tooltip="install now",
-            on_click=lambda _, gn=game_name, s=source, ig=igdb_game: self._queue_single(
-                gn, s, ig
-            ),
+            on_click=partial(self._queue_single, game_name, source, igdb_game),
         )
-        return ft.Container(
+        container = ft.Container(
             content=ft.Row(
                 [
                     checkbox,
@@ -1055,20 +1346,20 @@ class InstallGameDialog:
                     ft.Container(
                         content=ft.Column(content_column, spacing=8),
                         expand=True,
-                        padding=ft.Padding.only(left=10),
+                        padding=self._DETAILS_PADDING,
                     ),
                     install_btn,
                 ],
                 spacing=10,
             ),
-            border=ft.border.all(
-                1, ft.Colors.PRIMARY if is_selected else ft.Colors.OUTLINE
-            ),
+            border=self._BORDER_SELECTED if is_selected else self._BORDER_UNSELECTED,
             border_radius=8,
             padding=10,
         )
+        self._card_by_name[game_name] = container
+        return container
 
-    def _toggle_selection(self, game_name: str) -> None:
+    def _toggle_selection(self, game_name: str, e=None) -> None:
         if game_name in self.selected_games:
             self.selected_games.remove(game_name)
         else:
@@ -1086,24 +1377,27 @@ class InstallGameDialog:
             self.install_button.text = "install selected"
             self.background_button.text = "download in background"
 
-        for i, (gn, _, _) in enumerate(self.game_results):
-            card = self.game_list.controls[i]
-            is_selected = gn in self.selected_games
-            card.border = ft.border.all(
-                1, ft.Colors.PRIMARY if is_selected else ft.Colors.OUTLINE
+        card = self._card_by_name.get(game_name)
+        if card:
+            card.border = (
+                self._BORDER_SELECTED
+                if game_name in self.selected_games
+                else self._BORDER_UNSELECTED
             )
+            card.update()
 
-        self.page.update()
+        self.install_button.update()
+        self.background_button.update()
 
-    def _install_selected(self, e) -> None:
-        games_to_install = [
-            (gn, s, ig) for gn, s, ig in self.game_results if gn in self.selected_games
+    def _selected_results(self) -> list[tuple]:
+        return [
+            result for result in self.game_results if result[0] in self.selected_games
         ]
 
-        for game_name, source, igdb_game in games_to_install:
-            self.download_manager.queue_download(
-                game_name, self.console, source, igdb_game
-            )
+    def _install_selected(self, e) -> None:
+        games_to_install = self._selected_results()
+
+        self.download_manager.queue_downloads(games_to_install, self.console)
 
         self.page.pop_dialog()
         self._show_info(
@@ -1112,14 +1406,9 @@ class InstallGameDialog:
         self.on_install()
 
     def _download_in_background(self, e) -> None:
-        games_to_queue = [
-            (gn, s, ig) for gn, s, ig in self.game_results if gn in self.selected_games
-        ]
+        games_to_queue = self._selected_results()
 
-        for game_name, source, igdb_game in games_to_queue:
-            self.download_manager.queue_download(
-                game_name, self.console, source, igdb_game
-            )
+        self.download_manager.queue_downloads(games_to_queue, self.console)
 
         self.page.pop_dialog()
         self._show_info(
@@ -1127,30 +1416,14 @@ class InstallGameDialog:
             f"downloading {len(games_to_queue)} games in background",
         )
 
-    def _queue_single(self, game_name: str, source, igdb_game) -> None:
+    def _queue_single(self, game_name: str, source, igdb_game, e=None) -> None:
         self.download_manager.queue_download(game_name, self.console, source, igdb_game)
 
         self.page.pop_dialog()
         self._show_info("download started", f"downloading {game_name}")
 
-    def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
 
-    def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
-
-class EditMetadataDialog:
+class EditMetadataDialog(_NotifyMixin):
     def __init__(self, page: ft.Page, game, on_save: Callable) -> None:
         self.page = page
         self.game = game
@@ -1169,11 +1442,7 @@ class EditMetadataDialog:
             label="region", value=self.game.metadata.region
         )
 
-        publisher = (
-            list(self.game.metadata.publisher.values())[0]
-            if self.game.metadata.publisher
-            else ""
-        )
+        publisher = next(iter(self.game.metadata.publisher.values()), "")
         self.publisher_input = ft.TextField(label="publisher", value=publisher)
 
         return ft.AlertDialog(
@@ -1196,7 +1465,12 @@ class EditMetadataDialog:
             ],
         )
 
-    def _on_submit(self, e) -> None:
+    async def _on_submit(self, e) -> None:
+        year = self.year_input.value.strip()
+        if not year.isdecimal():
+            self._show_error("error", "year must be a number")
+            return
+
         region = self.region_input.value
         new_metadata = GameMetadata(
             code=self.code_input.value,
@@ -1204,24 +1478,27 @@ class EditMetadataDialog:
             id=self.game.metadata.id,
             title={region: self.title_input.value},
             publisher={region: self.publisher_input.value},
-            year=int(self.year_input.value),
+            year=int(year),
             region=region,
             has_dlc=self.game.metadata.has_dlc,
             has_updates=self.game.metadata.has_updates,
         )
-        new_metadata.save(self.game.path / "metadata.json")
+        await asyncio.to_thread(new_metadata.save, self.game.path / "metadata.json")
         self.game.metadata = new_metadata
 
         self.page.pop_dialog()
         self.on_save()
 
 
-class ArtworkDialog:
+class ArtworkDialog(_NotifyMixin):
     def __init__(self, page: ft.Page, game, steamgrid, on_download: Callable) -> None:
         self.page = page
         self.game = game
         self.steamgrid = steamgrid
         self.on_download = on_download
+        self._searched_query = None
+        self._search_generation = 0
+        self._tab_cards: list[list[ft.Control]] = [[] for _ in range(4)]
 
     def create(self) -> ft.AlertDialog:
         self.search_input = ft.TextField(
@@ -1229,17 +1506,11 @@ class ArtworkDialog:
             value=self.game.metadata.get_title(),
         )
 
-        self.results_grids = [
-            ft.GridView(
-                expand=True,
-                runs_count=3,
-                max_extent=200,
-                child_aspect_ratio=1.0,
-                spacing=10,
-                run_spacing=10,
-            )
-            for _ in range(4)
-        ]
+        self.results_grids: dict[int, ft.GridView] = {}
+        self.tab_view = ft.TabBarView(
+            expand=True,
+            controls=[ft.Container() for _ in range(4)],
+        )
 
         tabs = ft.Tabs(
             selected_index=0,
@@ -1256,13 +1527,10 @@ class ArtworkDialog:
                             ft.Tab(label="icon"),
                         ]
                     ),
-                    ft.TabBarView(
-                        expand=True,
-                        controls=self.results_grids,
-                    ),
+                    self.tab_view,
                 ],
             ),
-            on_change=lambda _: self._on_search(None),
+            on_change=self._on_tab_change,
         )
 
         self.tabs = tabs
@@ -1294,72 +1562,132 @@ class ArtworkDialog:
             on_dismiss=lambda _: self.page.pop_dialog(),
         )
 
-    def _on_search(self, e) -> None:
-        selected_index = self.tabs.selected_index
-        results = self.results_grids[selected_index]
-        results.controls.clear()
+    def _show_tab(self, index: int) -> None:
+        grid = self.results_grids.get(index)
+        if grid is None:
+            grid = ft.GridView(
+                controls=self._tab_cards[index],
+                expand=True,
+                runs_count=3,
+                max_extent=200,
+                child_aspect_ratio=1.0,
+                spacing=10,
+                run_spacing=10,
+            )
+            self.results_grids[index] = grid
+            self.tab_view.controls[index] = grid
+            self.tab_view.update()
+            return
 
-        games = self.steamgrid.search_game(self.search_input.value)
+        grid.controls = self._tab_cards[index]
+        grid.update()
 
-        if not games:
-            results.controls.append(ft.Text("no results found"))
-            self.page.update()
+    async def _on_tab_change(self, e) -> None:
+        if self.search_input.value != self._searched_query:
+            await self._on_search(e)
             return
 
-        game_id = games[0].get("id")
+        self._show_tab(self.tabs.selected_index)
 
-        asset_types = ["grids", "heroes", "logos", "icons"]
-        file_names = ["grid", "hero", "logo", "icon"]
-        asset_type = asset_types[selected_index]
-        file_name = file_names[selected_index]
+    async def _on_search(self, e) -> None:
+        self._search_generation += 1
+        generation = self._search_generation
 
-        assets = self.steamgrid.get_assets(game_id, asset_type)
+        query = self.search_input.value
 
-        for asset in assets[:12]:
-            url = asset.get("thumb") or asset.get("url")
-            if not url:
-                continue
+        games = await asyncio.to_thread(self.steamgrid.search_game, query)
+        if generation != self._search_generation:
+            return
 
-            card = ft.Container(
-                content=ft.Image(src=url, fit=ft.BoxFit.COVER),
-                border_radius=8,
-                ink=True,
-                on_click=lambda _,
-                full_url=asset.get("url"),
-                fn=file_name: self._download(full_url, fn),
+        if games:
+            game_id = games[0].get("id")
+
+            asset_types = ["grids", "heroes", "logos", "icons"]
+            file_names = ["grid", "hero", "logo", "icon"]
+
+            all_assets = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self.steamgrid.get_assets, game_id, asset_type)
+                    for asset_type in asset_types
+                )
             )
-            results.controls.append(card)
 
-        self.page.update()
+            tab_pairs = [
+                [
+                    (thumb, asset.get("url"))
+                    for asset in assets[:12]
+                    if (thumb := asset.get("thumb") or asset.get("url"))
+                ]
+                for assets in all_assets
+            ]
+
+            loop = asyncio.get_running_loop()
+            thumb_urls = {thumb for pairs in tab_pairs for thumb, _ in pairs}
+            thumb_paths = dict(
+                zip(
+                    thumb_urls,
+                    await asyncio.gather(
+                        *(
+                            loop.run_in_executor(
+                                _thumb_pool, self.steamgrid.get_thumbnail, url
+                            )
+                            for url in thumb_urls
+                        )
+                    ),
+                )
+            )
+
+            if generation != self._search_generation:
+                return
+
+            self._tab_cards = [
+                [
+                    self._make_card(thumb_paths.get(thumb) or thumb, full, file_name)
+                    for thumb, full in pairs
+                ]
+                for file_name, pairs in zip(file_names, tab_pairs)
+            ]
+        else:
+            self._tab_cards = [[ft.Text("no results found")] for _ in range(4)]
+
+        self._searched_query = query
+        self._show_tab(self.tabs.selected_index)
+
+    def _make_card(self, thumb, full_url: str, file_name: str) -> ft.Container:
+        return ft.Container(
+            content=ft.Image(
+                src=str(thumb),
+                fit=ft.BoxFit.COVER,
+                filter_quality=ft.FilterQuality.LOW,
+            ),
+            border_radius=8,
+            ink=True,
+            on_click=partial(self._download, full_url, file_name),
+        )
+
+    async def _download(self, url: str, asset_type: str, e=None) -> None:
+        card = e.control if e else None
+        if card:
+            thumbnail = card.content
+            card.content = ft.ProgressRing()
+            card.disabled = True
+            self.page.update()
 
-    def _download(self, url: str, asset_type: str) -> None:
         graphics_dir = self.game.path / "graphics"
         graphics_dir.mkdir(parents=True, exist_ok=True)
         dest = graphics_dir / f"{asset_type}.png"
 
-        if self.steamgrid.download_asset(url, dest):
+        if await asyncio.to_thread(self.steamgrid.download_asset, url, dest):
             self.page.pop_dialog()
             self._show_info("success", f"downloaded {asset_type}")
             self.on_download()
         else:
+            if card:
+                card.content = thumbnail
+                card.disabled = False
+                self.page.update()
             self._show_error("error", "download failed")
 
-    def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
-    def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
 
 class ConsoleInfoDialog:
     def __init__(self, page: ft.Page, console_meta, library) -> None:
@@ -1373,25 +1701,24 @@ class ConsoleInfoDialog:
 
         console_dir = self.library.console_root / self.console_meta.name
         emulator_dir = console_dir / "emulator"
-        status = (
-            "installed"
-            if emulator_dir.exists() and any(emulator_dir.iterdir())
-            else "not installed"
-        )
+        status = "installed" if _is_installed(emulator_dir) else "not installed"
 
         graphics_dir = console_dir / "graphics"
         hero_path = graphics_dir / "hero.png"
         logo_path = graphics_dir / "logo.png"
 
+        hero_image = _image_src(hero_path)
+
         hero_content = []
-        if hero_path.exists():
+        if hero_image is not None:
+            logo_image = _image_src(logo_path)
             logo_widget = (
                 ft.Image(
-                    src=str(logo_path),
+                    src=logo_image,
                     width=300,
                     fit=ft.BoxFit.CONTAIN,
                 )
-                if logo_path.exists()
+                if logo_image is not None
                 else ft.Text(
                     self.console_meta.name,
                     size=32,
@@ -1400,11 +1727,11 @@ class ConsoleInfoDialog:
                 )
             )
 
-            hero_stack = ft.Container(
+            self._hero_container = ft.Container(
                 content=ft.Stack(
                     [
                         ft.Image(
-                            src=str(hero_path),
+                            src=hero_image,
                             width=600,
                             height=300,
                             fit=ft.BoxFit.COVER,
@@ -1432,22 +1759,29 @@ class ConsoleInfoDialog:
                 width=600,
                 height=300,
             )
-            hero_content.append(hero_stack)
+            hero_content.append(self._hero_container)
+
+            if logo_image is not None:
+                self.page.run_task(self._load_composite, hero_path, logo_path)
 
         content = ft.Column(
             [
                 *hero_content,
                 ft.Container(height=20),
-                ft.Text(f"code: {self.console_meta.code}"),
-                ft.Text(f"manufacturer: {self.console_meta.manufacturer}"),
-                ft.Text(f"release: {self.console_meta.release}"),
-                ft.Text(f"generation: {self.console_meta.generation or 'n/a'}"),
-                ft.Text(f"formats: {', '.join(self.console_meta.formats)}"),
+                ft.Text(
+                    f"code: {self.console_meta.code}\n"
+                    f"manufacturer: {self.console_meta.manufacturer}\n"
+                    f"release: {self.console_meta.release}\n"
+                    f"generation: {self.console_meta.generation or 'n/a'}\n"
+                    f"formats: {', '.join(self.console_meta.formats)}"
+                ),
                 ft.Container(height=20),
                 ft.Text("emulator", size=18, weight=ft.FontWeight.BOLD),
-                ft.Text(f"name: {self.console_meta.emulator.name}"),
-                ft.Text(f"binary: {self.console_meta.emulator.binary}"),
-                ft.Text(f"status: {status}"),
+                ft.Text(
+                    f"name: {self.console_meta.emulator.name}\n"
+                    f"binary: {self.console_meta.emulator.binary}\n"
+                    f"status: {status}"
+                ),
             ],
             tight=True,
             scroll=ft.ScrollMode.AUTO,
@@ -1461,13 +1795,27 @@ class ConsoleInfoDialog:
             ],
         )
 
+    async def _load_composite(self, hero_path: Path, logo_path: Path) -> None:
+        composite = await asyncio.to_thread(_hero_composite, hero_path, logo_path)
+        if not composite:
+            return
+
+        self._hero_container.content = ft.Image(
+            src=str(composite), width=600, height=300, fit=ft.BoxFit.COVER
+        )
+        try:
+            self._hero_container.update()
+        except Exception:
+            pass
+
 
-class IGDBSearchDialog:
+class IGDBSearchDialog(_NotifyMixin):
     def __init__(self, page: ft.Page, game, db, on_update: Callable) -> None:
         self.page = page
         self.game = game
         self.db = db
         self.on_update = on_update
+        self._search_generation = 0
 
     def create(self) -> ft.AlertDialog:
         self.search_input = ft.TextField(
@@ -1504,7 +1852,10 @@ class IGDBSearchDialog:
             ],
         )
 
-    def _on_search(self, e) -> None:
+    async def _on_search(self, e) -> None:
+        self._search_generation += 1
+        generation = self._search_generation
+
         self.results_list.controls.clear()
         self.progress_bar.visible = True
         query = self.search_input.value
@@ -1516,24 +1867,27 @@ class IGDBSearchDialog:
             return
 
         try:
-            games = self.db.search_games(query)
+            games = await asyncio.to_thread(self.db.search_games, query)
+            if generation != self._search_generation:
+                return
 
             self.progress_bar.visible = False
 
             if not games:
-                self.results_list.controls.append(
+                self.results_list.controls = [
                     ft.Text("no results found", color=ft.Colors.ON_SURFACE_VARIANT)
-                )
+                ]
             else:
-                for igdb_game in games[:20]:
-                    btn = ft.ListTile(
+                self.results_list.controls = [
+                    ft.ListTile(
                         title=ft.Text(igdb_game.name),
                         subtitle=ft.Text(
                             f"{igdb_game.platform} • {igdb_game.year or '?'} • {igdb_game.publisher or 'unknown'}"
                         ),
-                        on_click=lambda _, g=igdb_game: self._select_game(g),
+                        on_click=partial(self._select_game, igdb_game),
                     )
-                    self.results_list.controls.append(btn)
+                    for igdb_game in games[:20]
+                ]
 
             self.page.update()
 
@@ -1544,28 +1898,29 @@ class IGDBSearchDialog:
             )
             self.page.update()
 
-    def _select_game(self, igdb_game) -> None:
-        self.game.metadata.id = igdb_game.id
-        self.game.metadata.title = {"NA": igdb_game.name}
-        self.game.metadata.publisher = {"NA": igdb_game.publisher or "unknown"}
-        self.game.metadata.year = igdb_game.year or 0
+    async def _select_game(self, igdb_game, e=None) -> None:
+        metadata = self.game.metadata
+        previous = (metadata.id, metadata.title, metadata.publisher, metadata.year)
 
-        self.game.metadata.save(self.game.path / "metadata.json")
+        metadata.id = igdb_game.id
+        metadata.title = {"NA": igdb_game.name}
+        metadata.publisher = {"NA": igdb_game.publisher or "unknown"}
+        metadata.year = igdb_game.year or 0
 
         self.page.pop_dialog()
         self._show_info("success", f"updated metadata to: {igdb_game.name}")
-        self.on_update()
 
-    def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
+        try:
+            await asyncio.to_thread(metadata.save, self.game.path / "metadata.json")
+        except OSError as ex:
+            metadata.id, metadata.title, metadata.publisher, metadata.year = previous
+            self._show_error("error", f"failed to save metadata: {ex}")
+            return
+
+        self.on_update()
 
 
-class ModManagerDialog:
+class ModManagerDialog(_NotifyMixin):
     def __init__(
         self,
         page: ft.Page,
@@ -1575,7 +1930,41 @@ class ModManagerDialog:
         self.page = page
         self.mod_manager = mod_manager
         self.on_save = on_save
-        self.file_picker = None
+        self.file_picker = ft.FilePicker()
+        self._confirm_dialog: Optional[ft.AlertDialog] = None
+        self._name_dialog: Optional[ft.AlertDialog] = None
+        self._pending_mod: Optional["ModInfo"] = None
+        self._pending_path: Optional[Path] = None
+
+    def _ensure_dialogs(self) -> None:
+        if self._confirm_dialog is not None:
+            return
+
+        self._confirm_dialog = ft.AlertDialog(
+            title=ft.Text("remove mod"),
+            content=ft.Text(""),
+            actions=[
+                ft.TextButton("cancel", on_click=lambda _: self.page.pop_dialog()),
+                ft.FilledButton(
+                    "remove",
+                    on_click=lambda _: self._confirm_remove(self._pending_mod),
+                ),
+            ],
+        )
+        self._name_dialog = ft.AlertDialog(
+            title=ft.Text("add mod"),
+            content=ft.TextField(label="mod name"),
+            actions=[
+                ft.TextButton("cancel", on_click=lambda _: self.page.pop_dialog()),
+                ft.FilledButton(
+                    "add",
+                    on_click=lambda _: self._confirm_add_mod(
+                        self._pending_path,
+                        self._name_dialog.content.value,
+                    ),
+                ),
+            ],
+        )
 
     def create(self) -> ft.AlertDialog:
         self.mod_list = ft.Column(
@@ -1607,7 +1996,7 @@ class ModManagerDialog:
                                 ft.IconButton(
                                     icon=ft.Icons.REFRESH,
                                     tooltip="refresh",
-                                    on_click=lambda _: self._refresh(),
+                                    on_click=self._refresh,
                                 ),
                             ]
                         ),
@@ -1664,7 +2053,7 @@ class ModManagerDialog:
     def _create_mod_card(self, mod: "ModInfo") -> ft.Container:
         enable_switch = ft.Switch(
             value=mod.enabled,
-            on_change=lambda e, m=mod: self._toggle_mod(m, e.control.value),
+            on_change=partial(self._toggle_mod, mod),
         )
 
         install_path_input = ft.TextField(
@@ -1672,10 +2061,9 @@ class ModManagerDialog:
             value=mod.install_path,
             hint_text="leave blank for default",
             dense=True,
-            on_change=lambda e, m=mod: self._update_install_path(m, e.control.value),
+            on_change=partial(self._update_install_path, mod),
         )
 
-        details_visible = False
         details_container = ft.Container(
             content=ft.Column(
                 [
@@ -1689,12 +2077,6 @@ class ModManagerDialog:
             padding=ft.Padding.only(top=10),
         )
 
-        def toggle_details(e):
-            nonlocal details_visible
-            details_visible = not details_visible
-            details_container.visible = details_visible
-            self.page.update()
-
         return ft.Container(
             content=ft.Column(
                 [
@@ -1727,13 +2109,15 @@ class ModManagerDialog:
                             ),
                             ft.IconButton(
                                 icon=ft.Icons.INFO_OUTLINE,
-                                on_click=toggle_details,
+                                on_click=partial(
+                                    self._toggle_details, details_container
+                                ),
                                 tooltip="show details",
                             ),
                             enable_switch,
                             ft.IconButton(
                                 icon=ft.Icons.DELETE_OUTLINE,
-                                on_click=lambda _, m=mod: self._remove_mod(m),
+                                on_click=partial(self._remove_mod, mod),
                                 tooltip="remove mod",
                             ),
                         ],
@@ -1752,8 +2136,12 @@ class ModManagerDialog:
             animate=ft.Animation(300, ft.AnimationCurve.EASE_OUT),
         )
 
-    def _toggle_mod(self, mod: "ModInfo", enabled: bool) -> None:
-        if enabled:
+    def _toggle_details(self, details_container: ft.Container, e) -> None:
+        details_container.visible = not details_container.visible
+        self.page.update()
+
+    def _toggle_mod(self, mod: "ModInfo", e) -> None:
+        if e.control.value:
             self.mod_manager.enable_mod(mod.name, mod.install_path)
         else:
             self.mod_manager.disable_mod(mod.name)
@@ -1761,69 +2149,39 @@ class ModManagerDialog:
         self._populate_mods()
         self.page.update()
 
-    def _update_install_path(self, mod: "ModInfo", path: str) -> None:
-        mod.install_path = path
+    def _update_install_path(self, mod: "ModInfo", e) -> None:
+        mod.install_path = e.control.value
         self.mod_manager.save_config()
 
-    def _remove_mod(self, mod: "ModInfo") -> None:
-        confirm = ft.AlertDialog(
-            title=ft.Text("remove mod"),
-            content=ft.Text(f"are you sure you want to remove {mod.name}?"),
-            actions=[
-                ft.TextButton("cancel", on_click=lambda _: self.page.pop_dialog()),
-                ft.FilledButton(
-                    "remove",
-                    on_click=lambda _: self._confirm_remove(mod),
-                ),
-            ],
+    def _remove_mod(self, mod: "ModInfo", e=None) -> None:
+        self._ensure_dialogs()
+        self._pending_mod = mod
+        self._confirm_dialog.content.value = (
+            f"are you sure you want to remove {mod.name}?"
         )
-        self.page.show_dialog(confirm)
+        self.page.show_dialog(self._confirm_dialog)
 
     def _confirm_remove(self, mod: "ModInfo") -> None:
         self.page.pop_dialog()
 
         success = self.mod_manager.remove_mod(mod.name)
         if success:
-            self._refresh()
+            self.page.run_task(self._refresh)
         else:
-            error = ft.AlertDialog(
-                title=ft.Text("error"),
-                content=ft.Text("failed to remove mod"),
-                actions=[
-                    ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog()),
-                ],
-            )
-            self.page.show_dialog(error)
+            self._show_error("error", "failed to remove mod")
 
     async def _add_mod(self, e) -> None:
-        path = await ft.FilePicker().get_directory_path(
+        path = await self.file_picker.get_directory_path(
             dialog_title="select mod file or directory",
         )
         if not path:
             return
 
-        name_input = ft.TextField(
-            label="mod name",
-            value=Path(path).stem,
-        )
+        self._ensure_dialogs()
+        self._pending_path = Path(path)
+        self._name_dialog.content.value = self._pending_path.stem
 
-        name_dialog = ft.AlertDialog(
-            title=ft.Text("add mod"),
-            content=name_input,
-            actions=[
-                ft.TextButton("cancel", on_click=lambda _: self.page.pop_dialog()),
-                ft.FilledButton(
-                    "add",
-                    on_click=lambda _: self._confirm_add_mod(
-                        Path(path),
-                        name_input.value,
-                    ),
-                ),
-            ],
-        )
-
-        self.page.show_dialog(name_dialog)
-        self.page.update()
+        self.page.show_dialog(self._name_dialog)
 
     def _confirm_add_mod(self, source_path, name: str) -> None:
         self.page.pop_dialog()
@@ -1831,39 +2189,25 @@ class ModManagerDialog:
         success = self.mod_manager.add_mod(source_path, name or None)
 
         if success:
-            self._refresh()
-            info = ft.AlertDialog(
-                title=ft.Text("success"),
-                content=ft.Text(f"added mod: {name or source_path.stem}"),
-                actions=[
-                    ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog()),
-                ],
-            )
-            self.page.show_dialog(info)
+            self.page.run_task(self._refresh)
+            self._show_info("success", f"added mod: {name or source_path.stem}")
         else:
-            error = ft.AlertDialog(
-                title=ft.Text("error"),
-                content=ft.Text("failed to add mod"),
-                actions=[
-                    ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog()),
-                ],
-            )
-            self.page.show_dialog(error)
+            self._show_error("error", "failed to add mod")
 
-    def _refresh(self) -> None:
-        self.mod_manager._load_mods()
+    async def _refresh(self, e=None) -> None:
+        await asyncio.to_thread(self.mod_manager._load_mods)
         self._populate_mods()
         self.page.update()
 
     def _close(self) -> None:
-        if self.file_picker and self.file_picker in self.page.overlay:
-            self.page.overlay.remove(self.file_picker)
         self.page.pop_dialog()
         self.on_save()
 
 
-class SteamInstallDialog:
+class SteamInstallDialog(_NotifyMixin):
     def __init__(self, page: ft.Page, library, on_install: Callable):
+        from src.util.steam import SteamManager
+
         self.page = page
         self.library = library
         self.on_install = on_install
@@ -2028,8 +2372,6 @@ class SteamInstallDialog:
                 (game_dir / "graphics").mkdir(exist_ok=True)
 
                 if game_info and game_info.header_image:
-                    import requests
-
                     try:
                         img_response = requests.get(game_info.header_image, timeout=10)
                         if img_response.status_code == 200:
@@ -2063,25 +2405,11 @@ class SteamInstallDialog:
 
         threading.Thread(target=install_thread, daemon=True).start()
 
-    def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
-    def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
 
 class SteamProtonDialog:
     def __init__(self, page: ft.Page, game, on_save: Callable):
+        from src.util.steam import SteamManager
+
         self.page = page
         self.game = game
         self.on_save = on_save
@@ -2131,8 +2459,10 @@ class SteamProtonDialog:
         self.on_save()
 
 
-class GameBananaDialog:
+class GameBananaDialog(_NotifyMixin):
     def __init__(self, page: ft.Page, game, mod_manager, on_install: Callable):
+        from src.util.gb import GameBananaAPI
+
         self.page = page
         self.game = game
         self.mod_manager = mod_manager
@@ -2182,9 +2512,6 @@ class GameBananaDialog:
         )
 
     def _search(self) -> None:
-        import logging
-
-        logger = logging.getLogger(__name__)
         query = self.search_input.value
 
         self.mods_list.controls.clear()
@@ -2198,8 +2525,6 @@ class GameBananaDialog:
             logger.warning(f"game not found, trying console name search")
             console_meta = None
             try:
-                from src.data.console import get_console_metadata
-
                 console_meta = get_console_metadata(self.game.metadata.console)
             except:
                 pass
@@ -2372,19 +2697,3 @@ class GameBananaDialog:
                 self._show_error("error", f"failed to install: {str(e)}")
 
         threading.Thread(target=download, daemon=True).start()
-
-    def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
-
-    def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[ft.TextButton("ok", on_click=lambda _: self.page.pop_dialog())],
-        )
-        self.page.show_dialog(dialog)
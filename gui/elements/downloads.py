@@ -1,16 +1,33 @@
-from typing import TYPE_CHECKING
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Optional
 
 import flet as ft
 
 if TYPE_CHECKING:
     from download_manager import DownloadManager, DownloadStatus, DownloadTask
 
+_TERMINAL = frozenset({"complete", "failed"})
+_STATUS_COLORS = {
+    "complete": ft.Colors.GREEN,
+    "failed": ft.Colors.ERROR,
+    "queued": ft.Colors.ON_SURFACE_VARIANT,
+}
+
 
 class DownloadsPanel:
     def __init__(self, page: ft.Page, download_manager: "DownloadManager"):
         self.page = page
         self.download_manager = download_manager
         self.expanded = False
+        self._debounce_ms = 100
+        self._pending_refresh: Optional[threading.Timer] = None
+        self._refresh_lock = threading.Lock()
+        self._changed_ids: set[str] = set()
+        self._card_by_id: dict[str, dict] = {}
+        self._render_lock = asyncio.Lock()
+        self._last_fp: Optional[tuple] = None
+        self._restart_requested = False
 
         self.download_manager.add_callback(self._on_downloads_changed)
 
@@ -94,25 +111,104 @@ class DownloadsPanel:
 
     def _clear_completed(self):
         self.download_manager.clear_completed()
-        self._refresh()
+        self.page.run_task(self._refresh_async)
+
+    def _on_downloads_changed(self, changed: set[str]):
+        with self._refresh_lock:
+            self._changed_ids |= changed
+            if self._pending_refresh:
+                self._pending_refresh.cancel()
+
+            self._pending_refresh = threading.Timer(
+                self._debounce_ms / 1000, self._do_refresh
+            )
+            self._pending_refresh.daemon = True
+            self._pending_refresh.start()
+
+    def _do_refresh(self):
+        with self._refresh_lock:
+            self._pending_refresh = None
 
-    def _on_downloads_changed(self):
         try:
-            self._refresh()
-            self.page.update()
+            self.page.run_task(self._refresh_async)
         except Exception:
             pass
 
+    async def _refresh_async(self):
+        if self._render_lock.locked():
+            self._restart_requested = True
+            return
+
+        async with self._render_lock:
+            while True:
+                self._restart_requested = False
+                tasks = self.download_manager.get_all_tasks()
+                fp = self._task_fingerprint(tasks)
+                if fp == self._last_fp:
+                    break
+                with self._refresh_lock:
+                    changed = self._changed_ids
+                    self._changed_ids = set()
+                if self._refresh_header(tasks):
+                    self._drop_stale_cards(tasks)
+                    pending = [
+                        task
+                        for task in tasks
+                        if task.id in changed or task.id not in self._card_by_id
+                    ]
+                    for start in range(0, len(pending), 10):
+                        for task in pending[start : start + 10]:
+                            self._sync_card(task)
+                        await asyncio.sleep(0)
+                        if self._restart_requested:
+                            break
+                    if self._restart_requested:
+                        with self._refresh_lock:
+                            self._changed_ids |= changed
+                        continue
+                    self._assign_cards(tasks)
+                self._last_fp = fp
+                try:
+                    self.container.update()
+                except Exception:
+                    pass
+                if not self._restart_requested:
+                    break
+
     def _refresh(self):
         tasks = self.download_manager.get_all_tasks()
+        fp = self._task_fingerprint(tasks)
+        if fp == self._last_fp:
+            return
+        self._last_fp = fp
+        if not self._refresh_header(tasks):
+            return
+
+        self._drop_stale_cards(tasks)
+        for task in tasks:
+            self._sync_card(task)
+        self._assign_cards(tasks)
 
+    def _task_fingerprint(self, tasks: list["DownloadTask"]) -> tuple:
+        return tuple(
+            (t.id, t.status.value, round(t.progress, 3), t.error or "")
+            for t in tasks
+        )
+
+    def _refresh_header(self, tasks: list["DownloadTask"]) -> bool:
         if not tasks:
             self.container.visible = False
-            return
+            return False
 
         self.container.visible = True
 
-        active_count = len(self.download_manager.get_active_tasks())
+        active_count = 0
+        completed = False
+        for task in tasks:
+            if task.status.value in _TERMINAL:
+                completed = True
+            else:
+                active_count += 1
         total_count = len(tasks)
 
         if active_count > 0:
@@ -120,18 +216,55 @@ class DownloadsPanel:
         else:
             self.header_text.value = f"downloads ({total_count})"
 
-        completed = any(t.status.value in ["complete", "failed"] for t in tasks)
         self.clear_button.visible = completed
+        return True
 
-        self.downloads_list.controls.clear()
+    def _drop_stale_cards(self, tasks: list["DownloadTask"]) -> None:
+        task_ids = {task.id for task in tasks}
+        for task_id in self._card_by_id.keys() - task_ids:
+            del self._card_by_id[task_id]
 
-        for task in tasks:
-            card = self._create_download_card(task)
-            self.downloads_list.controls.append(card)
+    def _sync_card(self, task: "DownloadTask") -> None:
+        entry = self._card_by_id.get(task.id)
+        if entry is None:
+            self._create_download_card(task)
+        else:
+            self._update_download_card(entry, task)
+
+    def _assign_cards(self, tasks: list["DownloadTask"]) -> None:
+        self.downloads_list.controls = [
+            self._card_by_id[task.id]["container"] for task in tasks
+        ]
+
+    def _update_download_card(self, entry: dict, task: "DownloadTask") -> None:
+        status = task.status.value
+        running = status not in _TERMINAL
+
+        if (
+            status != entry["status"].value
+            or abs(task.progress - entry["last_progress"]) >= 0.01
+        ):
+            entry["progress"].value = task.progress
+            entry["last_progress"] = task.progress
+
+        entry["status"].value = status
+        entry["status"].color = self._get_status_color(status)
+        entry["progress"].visible = running
+        entry["close_btn"].visible = running
+        entry["error"].value = task.error or ""
+        entry["error"].visible = bool(task.error)
 
     def _create_download_card(self, task: "DownloadTask") -> ft.Container:
         status_color = self._get_status_color(task.status.value)
 
+        close_btn = ft.IconButton(
+            icon=ft.Icons.CLOSE,
+            icon_size=16,
+            data=task.id,
+            on_click=self._on_cancel_click,
+            visible=task.status.value not in _TERMINAL,
+        )
+
         title_row = ft.Row(
             [
                 ft.Text(
@@ -142,12 +275,7 @@ class DownloadsPanel:
                     overflow=ft.TextOverflow.ELLIPSIS,
                     expand=True,
                 ),
-                ft.IconButton(
-                    icon=ft.Icons.CLOSE,
-                    icon_size=16,
-                    on_click=lambda _, tid=task.id: self._cancel_download(tid),
-                    visible=task.status.value not in ["complete", "failed"],
-                ),
+                close_btn,
             ],
             spacing=5,
         )
@@ -161,27 +289,21 @@ class DownloadsPanel:
         progress_bar = ft.ProgressBar(
             value=task.progress,
             height=3,
-            visible=task.status.value not in ["complete", "failed"],
+            visible=task.status.value not in _TERMINAL,
         )
 
-        error_text = None
-        if task.error:
-            error_text = ft.Text(
-                task.error,
-                size=11,
-                color=ft.Colors.ERROR,
-                max_lines=2,
-                overflow=ft.TextOverflow.ELLIPSIS,
-            )
-
-        content_controls = [title_row, status_text, progress_bar]
-
-        if error_text:
-            content_controls.append(error_text)
+        error_text = ft.Text(
+            task.error or "",
+            size=11,
+            color=ft.Colors.ERROR,
+            max_lines=2,
+            overflow=ft.TextOverflow.ELLIPSIS,
+            visible=bool(task.error),
+        )
 
-        return ft.Container(
+        container = ft.Container(
             content=ft.Column(
-                content_controls,
+                [title_row, status_text, progress_bar, error_text],
                 spacing=5,
             ),
             padding=10,
@@ -189,19 +311,32 @@ class DownloadsPanel:
             bgcolor=ft.Colors.SURFACE_CONTAINER,
         )
 
+        self._card_by_id[task.id] = {
+            "container": container,
+            "progress": progress_bar,
+            "status": status_text,
+            "error": error_text,
+            "close_btn": close_btn,
+            "last_progress": task.progress,
+        }
+        return container
+
     def _get_status_color(self, status: str) -> str:
-        if status == "complete":
-            return ft.Colors.GREEN
-        elif status == "failed":
-            return ft.Colors.ERROR
-        elif status == "queued":
-            return ft.Colors.ON_SURFACE_VARIANT
-        else:
-            return ft.Colors.PRIMARY
+        return _STATUS_COLORS.get(status, ft.Colors.PRIMARY)
+
+    def _on_cancel_click(self, e):
+        self._cancel_download(e.control.data)
 
     def _cancel_download(self, task_id: str):
         self.download_manager.cancel_download(task_id)
-        self._refresh()
+        with self._refresh_lock:
+            self._changed_ids.add(task_id)
+        self.page.run_task(self._refresh_async)
 
     def cleanup(self):
         self.download_manager.remove_callback(self._on_downloads_changed)
+
+        with self._refresh_lock:
+            if self._pending_refresh:
+                self._pending_refresh.cancel()
+                self._pending_refresh = None
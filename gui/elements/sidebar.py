@@ -1,3 +1,5 @@
+import asyncio
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 import flet as ft
@@ -5,6 +7,10 @@ import flet as ft
 if TYPE_CHECKING:
     from gui.app import VRetroApp
 
+_GAME_ROW_WINDOW = 40
+_FALLBACK_GAME_ICON = ft.Icons.SPORTS_ESPORTS
+_FALLBACK_CONSOLE_ICON = ft.Icons.VIDEOGAME_ASSET
+
 
 class Sidebar:
     def __init__(self, app: "VRetroApp", library) -> None:
@@ -16,6 +22,17 @@ class Sidebar:
         self.collapsed = False
         self.content_column: ft.Column = None
         self.downloads_panel = None
+        self.refresh_button: ft.IconButton = None
+        self.scan_ring: ft.ProgressRing = None
+        self._icon_cache: dict[Path, Optional[str]] = {}
+        self._console_icons: dict[str, Optional[str]] = {}
+        self._refresh_pending = False
+        self._pending_games: list[tuple] = []
+        self._rendered_rows: Optional[list] = None
+        self._row_controls: dict[str, ft.Container] = {}
+        self._shown_selected: Optional[str] = None
+        self._game_rows_source: Optional[list] = None
+        self._game_rows: list[tuple[str, str, Optional[str], object]] = []
 
     def create(self, downloads_panel=None) -> ft.Container:
         self.downloads_panel = downloads_panel
@@ -29,7 +46,16 @@ class Sidebar:
         self.list_view = ft.ListView(
             spacing=5,
             expand=True,
+            scroll_interval=100,
+            on_scroll=self._on_list_scroll,
+        )
+
+        self.refresh_button = ft.IconButton(
+            icon=ft.Icons.REFRESH,
+            on_click=self._refresh_library,
+            tooltip="refresh library",
         )
+        self.scan_ring = ft.ProgressRing(width=16, height=16, visible=False)
 
         main_content = ft.Column(
             [
@@ -38,11 +64,8 @@ class Sidebar:
                         [
                             ft.Text("vretro", size=24, weight=ft.FontWeight.BOLD),
                             ft.Container(expand=True),
-                            ft.IconButton(
-                                icon=ft.Icons.REFRESH,
-                                on_click=lambda _: self._refresh_library(),
-                                tooltip="refresh library",
-                            ),
+                            self.scan_ring,
+                            self.refresh_button,
                             ft.IconButton(
                                 icon=ft.Icons.SETTINGS,
                                 on_click=lambda _: self.app.show_settings(),
@@ -139,35 +162,74 @@ class Sidebar:
             icon_button.left = None
             icon_button.right = 0
 
-        self.app.page.update()
+        self._update_page()
 
-    def _refresh_library(self) -> None:
-        self.app.library.scan(verbose=False)
-        self.refresh()
+    def _update_page(self) -> None:
+        self.app.update_page()
 
-        if self.app.current_console:
-            self.app.show_console(self.app.current_console)
-        else:
-            self.app._show_welcome()
+    async def _refresh_library(self, e=None) -> None:
+        self.scan_ring.visible = True
+        self.refresh_button.disabled = True
+        self._update_page()
 
-    def refresh(self) -> None:
-        self.list_view.controls.clear()
+        try:
+            await asyncio.to_thread(self.app.library.scan, verbose=False)
+        finally:
+            self.scan_ring.visible = False
+            self.refresh_button.disabled = False
 
-        if not self.app.current_console:
-            self._populate_consoles()
-        else:
-            self._populate_games()
+        self.invalidate_icons()
 
-        if self.app.page:
-            self.app.page.update()
+        with self.app.batch_updates():
+            self.request_refresh()
+            if self.app.current_console:
+                self.app.show_console(self.app.current_console)
+            else:
+                self.app._show_welcome()
+
+    def invalidate_icons(self) -> None:
+        self._icon_cache.clear()
+        self._console_icons.clear()
+        self._game_rows_source = None
+
+    def request_refresh(self) -> None:
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        self.app.page.run_task(self._flush_refresh)
+
+    async def _flush_refresh(self) -> None:
+        await asyncio.sleep(0)
+        self._refresh_pending = False
+        self.refresh()
 
-    def _populate_consoles(self) -> None:
+    def refresh(self) -> None:
+        if (
+            self.app.current_console
+            and self._rendered_rows is not None
+            and self._get_game_rows() is self._rendered_rows
+        ):
+            self._repaint_selection()
+            return
+
+        self._pending_games = []
+        self._rendered_rows = None
+        self._row_controls = {}
+        with self.app.batch_updates():
+            if not self.app.current_console:
+                controls = self._populate_consoles()
+            else:
+                controls = self._populate_games()
+            self.list_view.controls[:] = controls
+            self._update_page()
+
+    def _populate_consoles(self) -> list[ft.Control]:
         self.title_text.value = "consoles"
-        consoles = sorted(self.library.get_consoles())
+        controls: list[ft.Control] = []
+        counts = self.library.console_game_counts()
 
-        for console_code in consoles:
+        for console_code in self.library.get_consoles():
             console_meta = self.library.get_console_metadata(console_code)
-            games = self.library.filter_by_console(console_code)
             name = console_meta.name if console_meta else console_code
 
             icon_widget = self._get_console_icon(console_meta)
@@ -178,7 +240,7 @@ class Sidebar:
                     ft.Column(
                         [
                             ft.Text(name, size=16, weight=ft.FontWeight.W_500),
-                            ft.Text(f"{len(games)} games", size=12),
+                            ft.Text(f"{counts.get(console_code, 0)} games", size=12),
                         ],
                         spacing=2,
                     ),
@@ -191,9 +253,10 @@ class Sidebar:
                 padding=15,
                 border_radius=8,
                 ink=True,
-                on_click=lambda _, c=console_code: self.app.show_console(c),
+                data=console_code,
+                on_click=self._on_console_click,
             )
-            self.list_view.controls.append(btn)
+            controls.append(btn)
 
         add_btn = ft.Container(
             content=ft.Row(
@@ -207,9 +270,10 @@ class Sidebar:
             ink=True,
             on_click=lambda _: self.app.show_install_console(),
         )
-        self.list_view.controls.append(add_btn)
+        controls.append(add_btn)
+        return controls
 
-    def _populate_games(self) -> None:
+    def _populate_games(self) -> list[ft.Control]:
         console_meta = self.library.get_console_metadata(self.app.current_console)
         self.title_text.value = (
             console_meta.name if console_meta else self.app.current_console
@@ -227,78 +291,158 @@ class Sidebar:
             ink=True,
             on_click=lambda _: self._back_to_consoles(),
         )
-        self.list_view.controls.append(back_btn)
-        self.list_view.controls.append(ft.Divider(height=1))
-
-        games = sorted(self.app.all_games, key=lambda g: g.metadata.get_title())
+        controls: list[ft.Control] = [back_btn, ft.Divider(height=1)]
+
+        rows = self._get_game_rows()
+        selected = self._selected_code()
+        window = max(_GAME_ROW_WINDOW, self._row_index(rows, selected) + 1)
+        controls.extend(self._make_game_row(row, selected) for row in rows[:window])
+        self._pending_games = rows[window:]
+        self._rendered_rows = rows
+        self._shown_selected = selected
+
+        return controls
+
+    def _row_index(self, rows: list[tuple], code: Optional[str]) -> int:
+        if code is not None:
+            for index, row in enumerate(rows):
+                if row[1] == code:
+                    return index
+        return -1
+
+    def _repaint_selection(self) -> None:
+        selected = self._selected_code()
+        if selected == self._shown_selected:
+            return
+
+        if selected is not None and selected not in self._row_controls:
+            count = self._row_index(self._pending_games, selected) + 1
+            self.list_view.controls.extend(
+                self._make_game_row(row, selected)
+                for row in self._pending_games[:count]
+            )
+            self._pending_games = self._pending_games[count:]
+
+        previous = self._row_controls.get(self._shown_selected)
+        if previous is not None:
+            previous.bgcolor = None
+        current = self._row_controls.get(selected)
+        if current is not None:
+            current.bgcolor = ft.Colors.SURFACE_CONTAINER_HIGHEST
+        self._shown_selected = selected
+
+        try:
+            self.list_view.update()
+        except Exception:
+            pass
+
+    async def _on_list_scroll(self, e) -> None:
+        if not self._pending_games or e.pixels < e.max_scroll_extent - 200:
+            return
+
+        rows = self._pending_games[:_GAME_ROW_WINDOW]
+        self._pending_games = self._pending_games[_GAME_ROW_WINDOW:]
+        selected = self._selected_code()
+        self.list_view.controls.extend(
+            self._make_game_row(row, selected) for row in rows
+        )
+        self.list_view.update()
+
+    def _selected_code(self) -> Optional[str]:
+        game = self.app.current_game
+        return game.metadata.code if game else None
+
+    def _get_game_rows(self) -> list[tuple[str, str, Optional[str], object]]:
+        games = self.app.all_games
+        if self._game_rows_source is not games:
+            self._game_rows = []
+            for game in games:
+                graphics_dir = game.path / "graphics"
+                icon_src = self._resolve_icon(
+                    (graphics_dir / "icon.png", graphics_dir / "logo.png")
+                )
+                self._game_rows.append(
+                    (game.metadata.get_title(), game.metadata.code, icon_src, game)
+                )
+            self._game_rows_source = games
+        return self._game_rows
+
+    def _make_game_row(
+        self, row: tuple[str, str, Optional[str], object], selected: Optional[str]
+    ) -> ft.Control:
+        title, code, icon_src, game = row
+        if icon_src:
+            icon_widget = ft.Image(
+                src=icon_src,
+                width=32,
+                height=32,
+                fit=ft.BoxFit.CONTAIN,
+            )
+        else:
+            icon_widget = ft.Icon(_FALLBACK_GAME_ICON)
 
-        for game in games:
-            icon_widget = self._get_game_icon(game)
+        content = ft.Row(
+            [
+                icon_widget,
+                ft.Text(
+                    title,
+                    size=14,
+                    weight=ft.FontWeight.W_400,
+                    max_lines=2,
+                    overflow=ft.TextOverflow.ELLIPSIS,
+                ),
+            ],
+            spacing=10,
+        )
 
-            content = ft.Row(
-                [
-                    icon_widget,
-                    ft.Text(
-                        game.metadata.get_title(),
-                        size=14,
-                        weight=ft.FontWeight.W_400,
-                        max_lines=2,
-                        overflow=ft.TextOverflow.ELLIPSIS,
-                    ),
-                ],
-                spacing=10,
-            )
+        btn = ft.Container(
+            content=content,
+            padding=10,
+            border_radius=8,
+            bgcolor=ft.Colors.SURFACE_CONTAINER_HIGHEST if code == selected else None,
+            ink=True,
+            data=game,
+            on_click=self._on_game_click,
+        )
+        self._row_controls[code] = btn
+        return btn
 
-            selected = (
-                self.app.current_game
-                and self.app.current_game.metadata.code == game.metadata.code
-            )
+    def _on_console_click(self, e) -> None:
+        self.app.show_console(e.control.data)
 
-            btn = ft.Container(
-                content=content,
-                padding=10,
-                border_radius=8,
-                bgcolor=ft.Colors.SURFACE_CONTAINER_HIGHEST if selected else None,
-                ink=True,
-                on_click=lambda _, g=game: self.app.show_game(g),
-            )
-            self.list_view.controls.append(btn)
+    def _on_game_click(self, e) -> None:
+        self.app.show_game(e.control.data)
 
     def _back_to_consoles(self) -> None:
         self.app.current_console = None
         self.app.current_game = None
         self.app._show_welcome()
-        self.refresh()
+        self.request_refresh()
 
-    def _get_console_icon(self, console_meta) -> ft.Control:
-        if console_meta:
-            console_dir = self.library.console_root / console_meta.name
-            icon_path = console_dir / "graphics" / "icon.png"
-            if icon_path.exists():
-                return ft.Image(
-                    src=str(icon_path),
-                    width=32,
-                    height=32,
-                    fit=ft.BoxFit.CONTAIN,
-                )
-        return ft.Icon(ft.Icons.VIDEOGAME_ASSET)
+    def _resolve_icon(self, candidates: tuple[Path, ...]) -> Optional[str]:
+        key = candidates[0]
+        if key not in self._icon_cache:
+            self._icon_cache[key] = next(
+                (str(path) for path in candidates if path.exists()), None
+            )
+        return self._icon_cache[key]
 
-    def _get_game_icon(self, game) -> ft.Control:
-        icon_path = game.path / "graphics" / "icon.png"
-        logo_path = game.path / "graphics" / "logo.png"
+    def _get_console_icon(self, console_meta) -> ft.Control:
+        if not console_meta:
+            return ft.Icon(_FALLBACK_CONSOLE_ICON)
 
-        if icon_path.exists():
-            return ft.Image(
-                src=str(icon_path),
-                width=32,
-                height=32,
-                fit=ft.BoxFit.CONTAIN,
-            )
-        elif logo_path.exists():
-            return ft.Image(
-                src=str(logo_path),
-                width=32,
-                height=32,
-                fit=ft.BoxFit.CONTAIN,
+        if console_meta.name not in self._console_icons:
+            console_dir = self.library.console_root / console_meta.name
+            self._console_icons[console_meta.name] = self._resolve_icon(
+                (console_dir / "graphics" / "icon.png",)
             )
-        return ft.Icon(ft.Icons.SPORTS_ESPORTS)
+
+        src = self._console_icons[console_meta.name]
+        if src is None:
+            return ft.Icon(_FALLBACK_CONSOLE_ICON)
+        return ft.Image(
+            src=src,
+            width=32,
+            height=32,
+            fit=ft.BoxFit.CONTAIN,
+        )
@@ -1,15 +1,27 @@
+import queue
 import re
+import shutil
 import threading
 import time
 import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 from uuid import uuid4
 
 from src.data.library import GameMetadata, get_console_extension
 
+_SLUG_STRIP = re.compile(r"[^\w\s-]")
+_SLUG_DASH = re.compile(r"[-\s]+")
+_ARTWORK_FILES = (
+    ("grids", "grid.png"),
+    ("heroes", "hero.png"),
+    ("logos", "logo.png"),
+    ("icons", "icon.png"),
+)
+
 
 class DownloadStatus(Enum):
     QUEUED = "queued"
@@ -41,54 +53,100 @@ class DownloadManager:
         self.steamgrid = steamgrid
 
         self.tasks: dict[str, DownloadTask] = {}
-        self.active_downloads: int = 0
+        self._lock = threading.Lock()
         self.max_concurrent: int = 3
+        self._queue: queue.Queue[str] = queue.Queue()
+        self._job_pool = ThreadPoolExecutor(max_workers=self.max_concurrent)
 
-        self.callbacks: list[Callable] = []
+        self.callbacks: list[Callable[[set[str]], None]] = []
         self._last_notify: float = 0
         self._notify_throttle: float = 0.5
+        self._notify_lock = threading.Lock()
+        self._dirty_tasks: set[str] = set()
+        self._flush_timer: Optional[threading.Timer] = None
+
+        self._artwork_pool = ThreadPoolExecutor(max_workers=len(_ARTWORK_FILES))
 
-        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
-        self._worker_thread.start()
+        self._workers = [
+            threading.Thread(target=self._worker_loop, daemon=True)
+            for _ in range(self.max_concurrent)
+        ]
+        for worker in self._workers:
+            worker.start()
 
-    def add_callback(self, callback: Callable):
+    def add_callback(self, callback: Callable[[set[str]], None]):
         self.callbacks.append(callback)
 
-    def remove_callback(self, callback: Callable):
+    def remove_callback(self, callback: Callable[[set[str]], None]):
         if callback in self.callbacks:
             self.callbacks.remove(callback)
 
-    def _notify_callbacks(self):
-        current_time = time.time()
-        if current_time - self._last_notify < self._notify_throttle:
-            return
+    def _notify_callbacks(self, task_ids: Iterable[str] = ()):
+        with self._notify_lock:
+            self._dirty_tasks.update(task_ids)
+            elapsed = time.monotonic() - self._last_notify
+            if elapsed < self._notify_throttle:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        self._notify_throttle - elapsed, self._flush_notify
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+
+        self._fire_callbacks()
+
+    def _flush_notify(self):
+        with self._notify_lock:
+            self._flush_timer = None
+            if not self._dirty_tasks:
+                return
 
-        self._last_notify = current_time
-        for callback in self.callbacks:
+        self._fire_callbacks()
+
+    def _fire_callbacks(self):
+        with self._notify_lock:
+            changed = self._dirty_tasks
+            self._dirty_tasks = set()
+            self._last_notify = time.monotonic()
+
+        for callback in list(self.callbacks):
             try:
-                callback()
+                callback(changed)
             except Exception:
                 pass
 
     def queue_download(
         self, game_name: str, console: str, source, igdb_game=None
     ) -> str:
-        task_id = str(uuid4())
-
-        task = DownloadTask(
-            id=task_id,
-            game_name=game_name,
-            console=console,
-            status=DownloadStatus.QUEUED,
-            progress=0.0,
-            igdb_game=igdb_game,
-            source=source,
-        )
+        return self.queue_downloads([(game_name, source, igdb_game)], console)[0]
+
+    def queue_downloads(self, items: list[tuple], console: str) -> list[str]:
+        new_tasks = [
+            DownloadTask(
+                id=str(uuid4()),
+                game_name=game_name,
+                console=console,
+                status=DownloadStatus.QUEUED,
+                progress=0.0,
+                igdb_game=igdb_game,
+                source=source,
+            )
+            for game_name, source, igdb_game in items
+        ]
+
+        with self._lock:
+            self.tasks.update((task.id, task) for task in new_tasks)
+
+        for task in new_tasks:
+            self._queue.put(task.id)
+
+        self._notify_callbacks(task.id for task in new_tasks)
 
-        self.tasks[task_id] = task
-        self._notify_callbacks()
+        return [task.id for task in new_tasks]
 
-        return task_id
+    def submit(self, fn: Callable, *args) -> Future:
+        return self._job_pool.submit(fn, *args)
 
     def get_task(self, task_id: str) -> Optional[DownloadTask]:
         return self.tasks.get(task_id)
@@ -116,7 +174,7 @@ class DownloadManager:
             if task.status != DownloadStatus.COMPLETE:
                 task.status = DownloadStatus.FAILED
                 task.error = "cancelled by user"
-                self._notify_callbacks()
+                self._notify_callbacks((task_id,))
 
     def clear_completed(self):
         to_remove = [
@@ -128,34 +186,18 @@ class DownloadManager:
         for tid in to_remove:
             del self.tasks[tid]
 
-        self._notify_callbacks()
+        self._notify_callbacks(to_remove)
 
     def _worker_loop(self):
         while True:
-            time.sleep(0.5)
-
-            if self.active_downloads >= self.max_concurrent:
-                continue
-
-            queued = [
-                t for t in self.tasks.values() if t.status == DownloadStatus.QUEUED
-            ]
-
-            if not queued:
-                continue
-
-            task = queued[0]
-            self.active_downloads += 1
-
-            download_thread = threading.Thread(
-                target=self._process_download, args=(task,), daemon=True
-            )
-            download_thread.start()
+            task = self.tasks.get(self._queue.get())
+            if task and task.status == DownloadStatus.QUEUED:
+                self._process_download(task)
 
     def _update_task(self, task: DownloadTask, status: DownloadStatus, progress: float):
         task.status = status
         task.progress = progress
-        self._notify_callbacks()
+        self._notify_callbacks((task.id,))
 
     def _process_download(self, task: DownloadTask):
         try:
@@ -165,20 +207,19 @@ class DownloadManager:
             if not console_meta:
                 task.status = DownloadStatus.FAILED
                 task.error = "console not found"
-                self._notify_callbacks()
+                self._notify_callbacks((task.id,))
                 return
 
             console_dir = self.library.console_root / console_meta.name
             games_dir = console_dir / "games"
 
-            game_slug = re.sub(r"[^\w\s-]", "", task.game_name.lower())
-            game_slug = re.sub(r"[-\s]+", "-", game_slug).strip("-")
+            game_slug = _SLUG_DASH.sub(
+                "-", _SLUG_STRIP.sub("", task.game_name.lower())
+            ).strip("-")
 
             game_dir = games_dir / game_slug
-            game_dir.mkdir(parents=True, exist_ok=True)
-            (game_dir / "resources").mkdir(exist_ok=True)
-            (game_dir / "saves").mkdir(exist_ok=True)
-            (game_dir / "graphics").mkdir(exist_ok=True)
+            for sub in ("resources", "saves", "graphics"):
+                (game_dir / sub).mkdir(parents=True, exist_ok=True)
 
             download_dir = game_dir / "resources"
             extension = get_console_extension(console_code_upper)
@@ -191,7 +232,7 @@ class DownloadManager:
             if not success:
                 task.status = DownloadStatus.FAILED
                 task.error = "download failed"
-                self._notify_callbacks()
+                self._notify_callbacks((task.id,))
                 return
 
             if console_code_upper == "SWITCH" and dest_file.suffix == ".zip":
@@ -200,7 +241,7 @@ class DownloadManager:
                 if not self._extract_switch_game(dest_file, download_dir):
                     task.status = DownloadStatus.FAILED
                     task.error = "extraction failed"
-                    self._notify_callbacks()
+                    self._notify_callbacks((task.id,))
                     return
 
             self._update_task(task, DownloadStatus.METADATA, 0.6)
@@ -228,28 +269,11 @@ class DownloadManager:
                     self._update_task(task, DownloadStatus.ARTWORK, 0.8)
 
                     graphics_dir = game_dir / "graphics"
-                    graphics_dir.mkdir(parents=True, exist_ok=True)
 
                     search_name = (
                         task.igdb_game.name if task.igdb_game else task.game_name
                     )
-                    games = self.steamgrid.search_game(search_name)
-
-                    if games and len(games) > 0:
-                        game_id = games[0].get("id")
-
-                        for asset_type, file_name in [
-                            ("grids", "grid"),
-                            ("heroes", "hero"),
-                            ("logos", "logo"),
-                            ("icons", "icon"),
-                        ]:
-                            assets = self.steamgrid.get_assets(game_id, asset_type)
-                            if assets and len(assets) > 0:
-                                url = assets[0].get("url")
-                                if url:
-                                    dest = graphics_dir / f"{file_name}.png"
-                                    self.steamgrid.download_asset(url, dest)
+                    self._download_artwork(search_name, graphics_dir)
                 except Exception:
                     pass
 
@@ -258,28 +282,47 @@ class DownloadManager:
         except Exception as e:
             task.status = DownloadStatus.FAILED
             task.error = str(e)
-            self._notify_callbacks()
-        finally:
-            self.active_downloads -= 1
+            self._notify_callbacks((task.id,))
+
+    def _download_artwork(self, search_name: str, graphics_dir: Path) -> None:
+        games = self.steamgrid.search_game(search_name)
+        if not games:
+            return
+
+        game_id = games[0].get("id")
+
+        list(
+            self._artwork_pool.map(
+                lambda item: self._download_first_asset(
+                    game_id, item[0], graphics_dir / item[1]
+                ),
+                _ARTWORK_FILES,
+            )
+        )
+
+    def _download_first_asset(self, game_id: int, asset_type: str, dest: Path) -> None:
+        assets = self.steamgrid.get_assets(game_id, asset_type)
+        if assets:
+            url = assets[0].get("url")
+            if url:
+                self.steamgrid.download_asset(url, dest)
 
     def _extract_switch_game(self, zip_path: Path, dest_dir: Path) -> bool:
         try:
-            with zipfile.ZipFile(zip_path, "r") as zf:
+            with open(zip_path, "rb", buffering=1 << 20) as raw, zipfile.ZipFile(
+                raw, "r"
+            ) as zf:
                 xci_files = [f for f in zf.namelist() if f.lower().endswith(".xci")]
 
-                if xci_files:
-                    xci_file = xci_files[0]
-                    zf.extract(xci_file, dest_dir)
-
-                    extracted = dest_dir / xci_file
-                    target = dest_dir / "base.xci"
+                if not xci_files:
+                    return False
 
-                    if extracted != target:
-                        extracted.rename(target)
+                with zf.open(xci_files[0]) as src, open(
+                    dest_dir / "base.xci", "wb", buffering=0
+                ) as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
 
-                    zip_path.unlink()
-                    return True
-
-            return False
+            zip_path.unlink()
+            return True
         except Exception:
             return False
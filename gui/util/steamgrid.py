@@ -1,61 +1,161 @@
+import hashlib
 import json
+import shutil
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import requests
 
 from src.data.config import get_config_dir
+from src.util.net import TokenBucket, get_session
 
 
 class SteamGridDB:
-    def __init__(self) -> None:
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
         self.api_base = "https://www.steamgriddb.com/api/v2"
         self.api_key: Optional[str] = None
+        self._session = session or get_session()
+        self._rate_limit = TokenBucket(rate=4, capacity=4)
         self.cache_dir = get_config_dir() / "cache" / "steamgrid"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.thumb_dir = self.cache_dir / "thumbs"
+        self.thumb_dir.mkdir(exist_ok=True)
         self.cache_ttl = 86400 * 7
+        self.memory_cache_size = 256
+        self.thumb_cache_size = 2000
+        self._memory_cache: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(self.cache_dir / "steamgrid.sqlite"), check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, ts REAL NOT NULL, value BLOB NOT NULL)"
+        )
+        self._db.commit()
+        self._db_writer = ThreadPoolExecutor(max_workers=1)
+
+        threading.Thread(target=self._prune_cache, daemon=True).start()
+
+    def _prune_cache(self) -> None:
+        for legacy_file in self.cache_dir.glob("*.json"):
+            try:
+                legacy_file.unlink()
+            except OSError:
+                pass
+
+        self._prune_thumbnails()
+
+    def _prune_thumbnails(self) -> None:
+        now = time.time()
+        thumbs = []
+        for thumb_path in self.thumb_dir.glob("*.webp"):
+            try:
+                mtime = thumb_path.stat().st_mtime
+                if now - mtime > self.cache_ttl:
+                    thumb_path.unlink()
+                else:
+                    thumbs.append((mtime, thumb_path))
+            except OSError:
+                pass
+
+        if len(thumbs) > self.thumb_cache_size:
+            thumbs.sort()
+            for _, thumb_path in thumbs[: len(thumbs) - self.thumb_cache_size]:
+                try:
+                    thumb_path.unlink()
+                except OSError:
+                    pass
+
+    def _get_memory_cache(self, key: str) -> Optional[Any]:
+        with self._memory_lock:
+            entry = self._memory_cache.get(key)
+            if entry is None:
+                return None
 
-    def _get_cache(self, key: str) -> Optional[dict]:
-        safe_key = key.replace("/", "_").replace(":", "_")
-        cache_file = self.cache_dir / f"{safe_key}.json"
+            timestamp, value = entry
+            if time.time() - timestamp > self.cache_ttl:
+                del self._memory_cache[key]
+                return None
 
-        if not cache_file.exists():
-            return None
+            self._memory_cache.move_to_end(key)
+            return value
 
-        try:
-            with open(cache_file, "r") as f:
-                data = json.load(f)
+    def _set_memory_cache(self, key: str, timestamp: float, value: Any) -> None:
+        with self._memory_lock:
+            self._memory_cache[key] = (timestamp, value)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.memory_cache_size:
+                self._memory_cache.popitem(last=False)
 
-            if time.time() - data.get("timestamp", 0) > self.cache_ttl:
-                cache_file.unlink()
+    def _get_cache(self, key: str) -> Optional[dict]:
+        cached = self._get_memory_cache(key)
+        if cached is not None:
+            return cached
+
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT ts, value FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                timestamp, blob = row
+
+            if time.time() - timestamp > self.cache_ttl:
+                self._db_writer.submit(
+                    self._write_db, "DELETE FROM cache WHERE key = ?", (key,)
+                )
                 return None
 
-            return data.get("value")
-        except:
+            value = json.loads(blob)
+            if value is not None:
+                self._set_memory_cache(key, timestamp, value)
+            return value
+        except (sqlite3.Error, json.JSONDecodeError):
             return None
 
     def _set_cache(self, key: str, value: dict) -> None:
-        safe_key = key.replace("/", "_").replace(":", "_")
-        cache_file = self.cache_dir / f"{safe_key}.json"
-
-        data = {"timestamp": time.time(), "value": value}
-
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+        timestamp = time.time()
+        self._set_memory_cache(key, timestamp, value)
+        self._db_writer.submit(
+            self._write_db,
+            "INSERT OR REPLACE INTO cache (key, ts, value) VALUES (?, ?, ?)",
+            (key, timestamp, json.dumps(value)),
+        )
+
+    def _write_db(self, statement: str, params: tuple) -> None:
+        try:
+            with self._db_lock:
+                self._db.execute(statement, params)
+                self._db.commit()
+        except sqlite3.Error:
+            pass
 
     def search_game(self, title: str) -> list:
         if not self.api_key:
             return []
 
-        cache_key = f"search_{title}"
+        cache_key = f"search_{title.strip().lower()}"
         cached = self._get_cache(cache_key)
         if cached is not None:
             return cached
 
+        self._rate_limit.acquire()
+
         try:
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            response = requests.get(
+            response = self._session.get(
                 f"{self.api_base}/search/autocomplete/{title}",
                 headers=headers,
                 timeout=10,
@@ -70,6 +170,18 @@ class SteamGridDB:
 
         return []
 
+    def search_games_bulk(self, names: list[str]) -> dict[str, Optional[int]]:
+        if not self.api_key:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=16) as ex:
+            results = list(ex.map(self.search_game, names))
+
+        return {
+            name: games[0].get("id") if games else None
+            for name, games in zip(names, results)
+        }
+
     def get_assets(self, game_id: int, asset_type: str = "grids") -> list:
         if not self.api_key:
             return []
@@ -79,9 +191,11 @@ class SteamGridDB:
         if cached is not None:
             return cached
 
+        self._rate_limit.acquire()
+
         try:
             headers = {"Authorization": f"Bearer {self.api_key}"}
-            response = requests.get(
+            response = self._session.get(
                 f"{self.api_base}/{asset_type}/game/{game_id}",
                 headers=headers,
                 timeout=10,
@@ -98,14 +212,35 @@ class SteamGridDB:
 
     def download_asset(self, url: str, dest_path: Path) -> bool:
         try:
-            response = requests.get(url, stream=True, timeout=30)
-            if response.status_code == 200:
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(dest_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                return True
+            with self._session.get(url, stream=True, timeout=30) as response:
+                if response.status_code == 200:
+                    response.raw.decode_content = True
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(dest_path, "wb") as f:
+                        shutil.copyfileobj(response.raw, f, length=1 << 20)
+                    return True
         except Exception:
             pass
 
         return False
+
+    def get_thumbnail(self, url: str, size: int = 200) -> Optional[Path]:
+        thumb_path = self.thumb_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.webp"
+        if thumb_path.exists():
+            return thumb_path
+
+        try:
+            from PIL import Image
+
+            response = self._session.get(url, timeout=10)
+            if response.status_code != 200:
+                return None
+
+            img = Image.open(BytesIO(response.content))
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA")
+            img.thumbnail((size, size))
+            img.save(thumb_path, "WEBP")
+            return thumb_path
+        except Exception:
+            return None
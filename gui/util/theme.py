@@ -1,4 +1,7 @@
+import heapq
 import subprocess
+import time
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -10,6 +13,9 @@ class ThemeManager:
         self.theme_mode = "system"
         self.primary_color = None
         self.dynamic_source = None
+        self._color_cache: dict[tuple[str, int, bool], Optional[str]] = {}
+        self._xresources_cache: Optional[tuple[float, dict]] = None
+        self._xresources_ttl = 5.0
 
     def get_theme_mode(self) -> ft.ThemeMode:
         if self.theme_mode == "light":
@@ -63,6 +69,18 @@ class ThemeManager:
         return ft.ThemeMode.DARK
 
     def _read_xresources(self) -> dict:
+        now = time.monotonic()
+        if (
+            self._xresources_cache
+            and now - self._xresources_cache[0] < self._xresources_ttl
+        ):
+            return self._xresources_cache[1]
+
+        resources = self._parse_xresources(Path.home() / ".Xresources")
+        self._xresources_cache = (now, resources)
+        return resources
+
+    def _parse_xresources(self, x_path: Path) -> dict:
         resources = {}
         try:
             result = subprocess.run(
@@ -72,7 +90,6 @@ class ThemeManager:
             if result.returncode == 0:
                 lines = result.stdout.splitlines()
             else:
-                x_path = Path.home() / ".Xresources"
                 lines = x_path.read_text().splitlines() if x_path.exists() else []
 
             for line in lines:
@@ -98,7 +115,9 @@ class ThemeManager:
             return luminance > 0.5
         return False
 
-    def extract_color_from_image(self, image_path: Path) -> Optional[str]:
+    def extract_color_from_image(
+        self, image_path: Path, is_light: Optional[bool] = None
+    ) -> Optional[str]:
         try:
             import colorsys
 
@@ -108,22 +127,13 @@ class ThemeManager:
             img = img.resize((150, 150))
             img = img.convert("RGB")
 
-            pixels = list(img.getdata())
+            if is_light is None:
+                is_light = self.get_theme_mode() == ft.ThemeMode.LIGHT
 
-            is_light = self.get_theme_mode() == ft.ThemeMode.LIGHT
+            color_counts = img.getcolors(maxcolors=150 * 150) or []
+            sorted_colors = heapq.nlargest(20, color_counts, key=itemgetter(0))
 
-            color_counts = {}
-            for pixel in pixels:
-                if pixel in color_counts:
-                    color_counts[pixel] += 1
-                else:
-                    color_counts[pixel] = 1
-
-            sorted_colors = sorted(
-                color_counts.items(), key=lambda x: x[1], reverse=True
-            )
-
-            for color, _ in sorted_colors[:20]:
+            for _, color in sorted_colors:
                 r, g, b = color
 
                 if (r < 30 and g < 30 and b < 30) or (r > 225 and g > 225 and b > 225):
@@ -145,7 +155,7 @@ class ThemeManager:
                 return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
 
             if sorted_colors:
-                r, g, b = sorted_colors[0][0]
+                r, g, b = sorted_colors[0][1]
                 h, s, v = colorsys.rgb_to_hsv(r / 255, g / 255, b / 255)
 
                 if is_light:
@@ -163,10 +173,24 @@ class ThemeManager:
 
         return None
 
+    def _cached_image_color(self, image_path: Path) -> Optional[str]:
+        is_light = self.get_theme_mode() == ft.ThemeMode.LIGHT
+        try:
+            mtime = image_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        key = (str(image_path), mtime, is_light)
+        if key not in self._color_cache:
+            self._color_cache[key] = self.extract_color_from_image(
+                image_path, is_light
+            )
+        return self._color_cache[key]
+
     def get_primary_color(self) -> Optional[str]:
         if self.theme_mode == "dynamic" and self.dynamic_source:
             if isinstance(self.dynamic_source, Path) and self.dynamic_source.exists():
-                color = self.extract_color_from_image(self.dynamic_source)
+                color = self._cached_image_color(self.dynamic_source)
                 if color:
                     return color
 
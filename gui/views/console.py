@@ -417,6 +417,7 @@ class ConsoleView:
             self.console_meta,
             self.app.library,
             lambda: self.app.show_console(self.app.current_console),
+            self.app.download_manager,
         )
         self.app.page.show_dialog(dialog.create())
 
@@ -435,16 +436,15 @@ class ConsoleView:
             self.console_meta,
             self.app.steamgrid,
             self.app.library,
-            lambda: self.app.show_console(self.app.current_console),
+            self._on_artwork_saved,
         )
         self.app.page.show_dialog(dialog.create())
 
+    def _on_artwork_saved(self) -> None:
+        self.app.sidebar.invalidate_icons()
+        self.app.show_console(self.app.current_console)
+
     def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[
-                ft.TextButton("ok", on_click=lambda _: self.app.page.pop_dialog()),
-            ],
-        )
-        self.app.page.show_dialog(dialog)
+        from ..elements.dialogs import show_message
+
+        show_message(self.app.page, title, message)
@@ -676,11 +676,7 @@ class GameView:
         )
 
     def _create_details_section(self) -> ft.Container:
-        publisher = (
-            list(self.game.metadata.publisher.values())[0]
-            if self.game.metadata.publisher
-            else "unknown"
-        )
+        publisher = next(iter(self.game.metadata.publisher.values()), "unknown")
 
         console_meta = self.app.library.get_console_metadata(self.game.metadata.console)
 
@@ -945,26 +941,20 @@ class GameView:
             self.app.page,
             self.game,
             self.app.steamgrid,
-            lambda: self.app.show_game(self.game),
+            self._on_artwork_saved,
         )
         self.app.page.show_dialog(dialog.create())
 
+    def _on_artwork_saved(self) -> None:
+        self.app.sidebar.invalidate_icons()
+        self.app.show_game(self.game)
+
     def _show_error(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[
-                ft.TextButton("ok", on_click=lambda _: self.app.page.pop_dialog()),
-            ],
-        )
-        self.app.page.show_dialog(dialog)
+        from ..elements.dialogs import show_message
+
+        show_message(self.app.page, title, message)
 
     def _show_info(self, title: str, message: str) -> None:
-        dialog = ft.AlertDialog(
-            title=ft.Text(title),
-            content=ft.Text(message),
-            actions=[
-                ft.TextButton("ok", on_click=lambda _: self.app.page.pop_dialog()),
-            ],
-        )
-        self.app.page.show_dialog(dialog)
+        from ..elements.dialogs import show_message
+
+        show_message(self.app.page, title, message)
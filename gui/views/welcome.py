@@ -59,18 +59,15 @@ class WelcomeView:
         if not self.app.library.consoles or not self.app.library.games:
             self.app.library.scan(verbose=False)
 
-        consoles = sorted(self.app.library.get_consoles())
+        counts = self.app.library.console_game_counts()
 
-        for console_code in consoles:
+        for console_code in self.app.library.get_consoles():
             console_meta = self.app.library.get_console_metadata(console_code)
-            games = [
-                g for g in self.app.library.games if g.metadata.console == console_code
-            ]
 
             card = ConsoleCard(
                 console_code,
                 console_meta,
-                len(games),
+                counts.get(console_code, 0),
                 lambda _, cc=console_code: self.app.show_console(cc),
                 self._get_console_path(console_meta),
             ).create()
@@ -1,6 +1,10 @@
+import hashlib
 import json
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -21,6 +25,16 @@ class OnlineGame:
     summary: Optional[str] = None
     genres: List[str] = None
 
+    @cached_property
+    def display_summary(self) -> Optional[str]:
+        if not self.summary or len(self.summary) <= 200:
+            return self.summary
+        return self.summary[:200] + "..."
+
+    @cached_property
+    def display_genres(self) -> str:
+        return " • ".join((self.genres or [])[:2])
+
     def to_json(self) -> dict:
         return {
             "id": self.id,
@@ -68,10 +82,11 @@ class DatabaseCache:
 
     def get(self, key: str) -> Optional[dict]:
         cache_file = self.cache_dir / f"{key}.json"
-        if not cache_file.exists():
-            return None
 
         try:
+            if not cache_file.exists():
+                return None
+
             with open(cache_file, "r") as f:
                 data = json.load(f)
 
@@ -80,15 +95,18 @@ class DatabaseCache:
                 return None
 
             return data.get("value")
-        except (json.JSONDecodeError, KeyError):
+        except (json.JSONDecodeError, KeyError, OSError):
             return None
 
     def set(self, key: str, value: dict):
         cache_file = self.cache_dir / f"{key}.json"
         data = {"timestamp": time.time(), "value": value}
 
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+        try:
+            with open(cache_file, "w") as f:
+                json.dump(data, f)
+        except OSError:
+            pass
 
     def clear(self):
         for cache_file in self.cache_dir.glob("*.json"):
@@ -118,13 +136,24 @@ PLATFORM_MAPPING = {
 
 
 class OnlineDatabase:
-    def __init__(self, config: Optional[VRetroConfig] = None):
+    def __init__(
+        self,
+        config: Optional[VRetroConfig] = None,
+        session: Optional[requests.Session] = None,
+    ):
+        from ..util.net import TokenBucket, get_session
+
         self.cache = DatabaseCache()
         self.github_api = "https://api.github.com"
         self.config = config or VRetroConfig.load()
         self.igdb_base = "https://api.igdb.com/v4"
         self._igdb_token = None
         self._token_expiry = 0
+        self._search_cache: OrderedDict[str, List[OnlineGame]] = OrderedDict()
+        self._search_cache_size = 256
+        self._search_lock = threading.Lock()
+        self._session = session or get_session()
+        self._rate_limit = TokenBucket(rate=4, capacity=4)
         self._emulator_database = self._load_emulator_database()
 
     def _load_emulator_database(self) -> Dict:
@@ -160,7 +189,7 @@ class OnlineDatabase:
                 "grant_type": "client_credentials",
             }
 
-            response = requests.post(url, params=params, timeout=10)
+            response = self._session.post(url, params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 token = data.get("access_token")
@@ -188,6 +217,8 @@ class OnlineDatabase:
         if not token:
             return None
 
+        self._rate_limit.acquire()
+
         try:
             headers = {
                 "Client-ID": self.config.igdb_client_id,
@@ -195,7 +226,7 @@ class OnlineDatabase:
                 "Accept": "application/json",
             }
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.igdb_base}/{endpoint}",
                 headers=headers,
                 data=query,
@@ -215,9 +246,31 @@ class OnlineDatabase:
         vrdb = get_vrdb()
         return vrdb.get_platform_id(platform_code.upper())
 
+    def _remember_search(self, key: str, results: List[OnlineGame]) -> None:
+        with self._search_lock:
+            self._search_cache[key] = results
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > self._search_cache_size:
+                self._search_cache.popitem(last=False)
+
     def search_games(
         self, query: str, platform: Optional[str] = None
     ) -> List[OnlineGame]:
+        normalized = " ".join(query.lower().split())
+        digest = hashlib.sha1(f"{platform or 'all'}|{normalized}".encode()).hexdigest()
+        cache_key = f"igdb_search_{digest}"
+
+        with self._search_lock:
+            if cache_key in self._search_cache:
+                self._search_cache.move_to_end(cache_key)
+                return list(self._search_cache[cache_key])
+
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            results = [OnlineGame(**game) for game in cached]
+            self._remember_search(cache_key, results)
+            return list(results)
+
         platform_filter = ""
         if platform:
             platform_id = get_platform_id(platform)
@@ -293,7 +346,10 @@ class OnlineDatabase:
                 )
             )
 
-        return results
+        self.cache.set(cache_key, [game.to_json() for game in results])
+        self._remember_search(cache_key, results)
+
+        return list(results)
 
     def get_game_details(self, game_id: int) -> Optional[GameDetails]:
         game_query = f"fields name, summary, storyline, screenshots.url, videos.video_id, genres.name, first_release_date, rating; where id = {game_id};"
@@ -391,7 +447,7 @@ class OnlineDatabase:
     def _get_latest_release(self, repo: str) -> Optional[str]:
         url = f"{self.github_api}/repos/{repo}/releases/latest"
         try:
-            response = requests.get(url, timeout=5)
+            response = self._session.get(url, timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 return data.get("tag_name")
@@ -1,4 +1,6 @@
 import json
+import os
+from collections import Counter
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Set
@@ -50,17 +52,19 @@ class GameMetadata:
         return asdict(self)
 
     def get_title(self, region: Optional[str] = None) -> str:
-        region = region or self.region
-        return self.title.get(
-            region, list(self.title.values())[0] if self.title else ""
-        )
+        title = self.title.get(region or self.region)
+        if title is not None:
+            return title
+        return next(iter(self.title.values()), "")
 
     def update_playtime(self, elapsed_seconds: int) -> None:
         self.playtime += elapsed_seconds
 
     def save(self, path: Path) -> None:
-        with open(path, "w") as f:
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
             json.dump(self.to_json(), f, indent=2)
+        os.replace(tmp_path, path)
 
 
 @dataclass
@@ -114,6 +118,8 @@ class GameLibrary:
         self.consoles: Dict[str, ConsoleMetadata] = {}
         self.ignored_dirs: Set[str] = set(ignored_dirs or [])
         self.debug = debug
+        self._sorted_consoles: Optional[List[str]] = None
+        self._console_counts: Optional[Dict[str, int]] = None
 
         if self.debug:
             print(f"[library] initialized with root: {self.games_root}")
@@ -123,12 +129,12 @@ class GameLibrary:
         verbose: bool = False,
         generate_metadata: bool = True,
     ) -> Dict[str, ConsoleMetadata]:
-        self.consoles = {}
+        consoles: Dict[str, ConsoleMetadata] = {}
 
         if not self.console_root.exists():
             if verbose or self.debug:
                 print(f"console root not found: {self.console_root}")
-            return self.consoles
+            return self._set_consoles(consoles)
 
         for console_dir in sorted(self.console_root.iterdir()):
             if not console_dir.is_dir():
@@ -145,9 +151,21 @@ class GameLibrary:
                     metadata.save(console_dir)
 
             if metadata:
-                self.consoles[metadata.code] = metadata
+                consoles[metadata.code] = metadata
+
+        return self._set_consoles(consoles)
+
+    def _set_consoles(
+        self, consoles: Dict[str, ConsoleMetadata]
+    ) -> Dict[str, ConsoleMetadata]:
+        self.consoles = consoles
+        self._invalidate_caches()
+        return consoles
 
-        return self.consoles
+    def _set_games(self, games: List[GameEntry]) -> List[GameEntry]:
+        self.games = games
+        self._invalidate_caches()
+        return games
 
     def scan(
         self,
@@ -155,13 +173,13 @@ class GameLibrary:
         scan_consoles: bool = True,
         auto_metadata: bool = False,
     ) -> List[GameEntry]:
-        self.games = []
+        games: List[GameEntry] = []
 
         if scan_consoles:
             self.scan_consoles(verbose=verbose)
 
         if not self.console_root.exists():
-            return self.games
+            return self._set_games(games)
 
         for console_dir in self.console_root.iterdir():
             if not console_dir.is_dir():
@@ -203,13 +221,13 @@ class GameLibrary:
                             saves_path=game_dir / "saves",
                             resources_path=resources_dir,
                         )
-                        self.games.append(entry)
+                        games.append(entry)
 
                 except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
                     if verbose or self.debug:
                         print(f"error loading {metadata_file}: {e}")
 
-        return self.games
+        return self._set_games(games)
 
     def _find_rom(self, resources_dir: Path, console: str) -> Optional[Path]:
         if not resources_dir.exists():
@@ -245,7 +263,20 @@ class GameLibrary:
         return None
 
     def get_consoles(self) -> List[str]:
-        return sorted(list(self.consoles.keys()))
+        if self._sorted_consoles is None:
+            self._sorted_consoles = sorted(self.consoles)
+        return list(self._sorted_consoles)
+
+    def console_game_counts(self) -> Dict[str, int]:
+        if self._console_counts is None:
+            self._console_counts = dict(
+                Counter(game.metadata.console for game in self.games)
+            )
+        return self._console_counts
+
+    def _invalidate_caches(self) -> None:
+        self._sorted_consoles = None
+        self._console_counts = None
 
     def get_console_metadata(self, code: str) -> Optional[ConsoleMetadata]:
         return self.consoles.get(code.upper())
@@ -283,6 +314,7 @@ class GameLibrary:
         )
 
         self.games.append(entry)
+        self._console_counts = None
         return entry
 
     def create_console(
@@ -306,5 +338,6 @@ class GameLibrary:
 
         metadata.save(console_dir)
         self.consoles[code_upper] = metadata
+        self._sorted_consoles = None
 
         return console_dir
@@ -3,13 +3,17 @@ from typing import List, Optional, Tuple
 
 import requests
 
+from .net import get_session
 from .vrdb import GameSource, get_vrdb
 
 
 class SourceManager:
-    def __init__(self, debug: bool = False):
+    def __init__(
+        self, debug: bool = False, session: Optional[requests.Session] = None
+    ):
         self.vrdb = get_vrdb()
         self.debug = debug
+        self._session = session or get_session()
 
         if self.debug:
             print("[sources] initialized")
@@ -52,7 +56,7 @@ class SourceManager:
             if source.scheme == "switch" and game_name:
                 file_url = f"{file_url}?filename={game_name}.zip"
 
-            response = requests.get(file_url, stream=True, timeout=30)
+            response = self._session.get(file_url, stream=True, timeout=30)
             if response.status_code != 200:
                 if self.debug:
                     print(f"[sources.download_file] http error: {response.status_code}")